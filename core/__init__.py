@@ -8,6 +8,7 @@ try:
     from .file_utils import (
         get_standardized_metadata,
         read_tree,
+        iter_tree,
         create_standardized_result,
         format_file_size,
         calculate_file_hash,
@@ -38,6 +39,7 @@ try:
         record_command_line_action,
         start_action_recording,
         stop_action_recording,
+        flush_action_recording,
         is_recording_enabled,
         get_log_file_path
     )
@@ -56,6 +58,7 @@ __all__ = [
     # File utilities
     'get_standardized_metadata',
     'read_tree',
+    'iter_tree',
     'create_standardized_result',
     'format_file_size',
     'calculate_file_hash',
@@ -71,6 +74,7 @@ __all__ = [
     'record_command_line_action',
     'start_action_recording',
     'stop_action_recording',
+    'flush_action_recording',
     'is_recording_enabled',
     'get_log_file_path',
     # detect_file utilities
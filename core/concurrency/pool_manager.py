@@ -5,10 +5,12 @@ No dependencies on other project modules.
 """
 import multiprocessing as mp
 from multiprocessing import Pool
+import threading
 import time
 import traceback
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Callable, Any, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Callable, Any, Optional, Tuple
 from enum import Enum
 from datetime import datetime
 from queue import PriorityQueue
@@ -87,6 +89,11 @@ class ManagedPool:
         self.pending_tasks: Dict[str, mp.pool.AsyncResult] = {}
         self.results: Dict[str, TaskResult] = {}
         
+        # Completion notifications from the pool's result handler thread
+        self._completion = threading.Condition()
+        self._done_ids = set()  # Finished tasks whose result is not collected yet
+        self._waiters: List[Tuple[set, deque]] = []  # (wanted ids, finished queue) per iter_completed() call
+        
         # Metrics
         self.metrics = PoolMetrics(
             pool_id=pool_id,
@@ -101,7 +108,12 @@ class ManagedPool:
         start_time = time.time()
         
         try:
-            async_result = self.pool.apply_async(func, args, kwargs or {})
+            on_done = lambda _value, task_id=task_id: self._mark_done(task_id)
+            async_result = self.pool.apply_async(
+                func, args, kwargs or {},
+                callback=on_done,
+                error_callback=on_done
+            )
             self.pending_tasks[task_id] = async_result
             self.metrics.tasks_submitted += 1
             return task_id
@@ -135,6 +147,8 @@ class ManagedPool:
                     )
                     self.results[task_id] = task_result
                     del self.pending_tasks[task_id]
+                    with self._completion:
+                        self._done_ids.discard(task_id)
                     
                     return task_result
                     
@@ -148,19 +162,82 @@ class ManagedPool:
                     )
                     self.results[task_id] = task_result
                     del self.pending_tasks[task_id]
+                    with self._completion:
+                        self._done_ids.discard(task_id)
                     
                     return task_result
         
         return None
     
+    def _mark_done(self, task_id: str):
+        """Record a finished task and wake up iter_completed() callers"""
+        with self._completion:
+            self._done_ids.add(task_id)
+            for wanted, finished in self._waiters:
+                if task_id in wanted:
+                    finished.append(task_id)
+            self._completion.notify_all()
+    
+    def iter_completed(self, task_ids: Iterable[str],
+                       timeout: float = 30.0) -> Iterator[Tuple[str, TaskResult]]:
+        """
+        Yield (task_id, TaskResult) for the given tasks in the order they finish
+        
+        Stops once every task has been yielded, or when no task finishes
+        within timeout seconds; tasks not yielded by then are still running.
+        """
+        remaining = set(task_ids)
+        finished = deque()
+        waiter = (remaining, finished)
+        
+        # Register before looking at past completions so none slips in between
+        with self._completion:
+            self._waiters.append(waiter)
+            collected = [task_id for task_id in remaining if task_id in self.results]
+            finished.extend(task_id for task_id in remaining
+                            if task_id not in self.results and task_id in self._done_ids)
+        
+        try:
+            # Results that were already collected come out first
+            for task_id in collected:
+                remaining.discard(task_id)
+                yield task_id, self.results[task_id]
+            
+            while remaining:
+                deadline = time.monotonic() + timeout
+                with self._completion:
+                    while not finished:
+                        left = deadline - time.monotonic()
+                        if left <= 0:
+                            return
+                        self._completion.wait(left)
+                    task_id = finished.popleft()
+                    if task_id not in remaining:
+                        continue
+                    remaining.discard(task_id)
+                
+                # The callback runs just before the AsyncResult is flagged ready
+                async_result = self.pending_tasks.get(task_id)
+                if async_result is not None:
+                    async_result.wait()
+                task_result = self.get_result(task_id)
+                if task_result is not None:
+                    yield task_id, task_result
+        finally:
+            with self._completion:
+                self._waiters = [w for w in self._waiters if w is not waiter]
+    
     def wait_all(self, timeout: float = 30.0):
         """Wait for all tasks to complete"""
-        start = time.time()
+        deadline = time.monotonic() + timeout
         
-        while self.pending_tasks and (time.time() - start) < timeout:
-            for task_id in list(self.pending_tasks.keys()):
-                self.get_result(task_id, timeout=0.1)
-            time.sleep(0.1)
+        # Block on each AsyncResult in turn instead of polling them all
+        for task_id, async_result in list(self.pending_tasks.items()):
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            async_result.wait(left)
+            self.get_result(task_id, timeout=0.1)
     
     def close(self):
         """Close pool (no more tasks)"""
@@ -235,15 +312,21 @@ class MultiprocessingManager:
     def wait_for_task(self, pool_id: str, task_id: str, 
                      timeout: float = 30.0) -> Optional[TaskResult]:
         """Wait for specific task to complete"""
-        start = time.time()
-        
-        while (time.time() - start) < timeout:
-            result = self.get_result(pool_id, task_id, timeout=0.1)
-            if result:
-                return result
-            time.sleep(0.1)
+        pool = self.pools.get(pool_id)
+        if pool is None:
+            return None
         
-        return None
+        # Block on the task's AsyncResult instead of sleeping between polls
+        async_result = pool.pending_tasks.get(task_id)
+        if async_result is not None:
+            async_result.wait(timeout)
+        return pool.get_result(task_id, timeout=0.1)
+    
+    def iter_completed(self, pool_id: str, task_ids: Iterable[str],
+                       timeout: float = 30.0) -> Iterator[Tuple[str, TaskResult]]:
+        """Yield (task_id, TaskResult) as tasks of a pool finish (see ManagedPool.iter_completed)"""
+        if pool_id in self.pools:
+            yield from self.pools[pool_id].iter_completed(task_ids, timeout)
     
     def wait_all_tasks(self, pool_id: str, timeout: float = 30.0):
         """Wait for all tasks in pool"""
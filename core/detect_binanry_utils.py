@@ -1,12 +1,16 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
+
+
+# Every check below looks at most at the first 0x8806 bytes (ISO volume
+# descriptor), so only this much of the payload is ever copied
+SNIFF_SIZE = 0x8807
 
 
 def detect_file_type(data: Union[bytes, bytearray, memoryview]) -> str:
     if not data:
         return '.bin'  
-    if isinstance(data, (bytearray, memoryview)):
-        data = bytes(data) 
+    data = bytes(data[:SNIFF_SIZE])
     if len(data) < 2 :
         return '.bin'  
     
@@ -85,7 +89,8 @@ def detect_file_type(data: Union[bytes, bytearray, memoryview]) -> str:
 
 
 
-def get_filename_with_correct_extension(filename: str, data: Union[bytes, bytearray, memoryview]) -> str:
+def get_filename_with_correct_extension(filename: str, data: Union[bytes, bytearray, memoryview],
+                                       detected_ext: Optional[str] = None) -> str:
     """
     Ensure a filename has the correct extension based on file content detection.
     If the filename already has an extension that matches the detected type, keep it.
@@ -94,17 +99,19 @@ def get_filename_with_correct_extension(filename: str, data: Union[bytes, bytear
     Args:
         filename: Original filename (may have wrong or no extension)
         data: File content bytes
+        detected_ext: detect_file_type(data), if the caller already has it
     
     Returns:
         Filename with correct extension
     """
-    if not filename:
+    if detected_ext is None:
         detected_ext = detect_file_type(data)
+    
+    if not filename:
         return f"attachment{detected_ext}"
     
     path = Path(filename)
     current_ext = path.suffix.lower()
-    detected_ext = detect_file_type(data)
     
     # If no extension or extension is .bin, use detected extension
     if not current_ext or current_ext == '.bin':
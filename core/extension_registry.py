@@ -5,29 +5,39 @@ Readers should call `get_extensions_for(key)` instead of re-defining
 their own `extensions_type_extract()` lists. This keeps the mappings
 in one place and makes it easy to keep them consistent.
 """
-from typing import Set, Dict
-
-_REGISTRY: Dict[str, Set[str]] = {
-    'pdf': {'.pdf'},
-    'office': {'.docx', '.doc', '.xlsx', '.xls', '.csv', '.pptx', '.ppt'},
-    'image': {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.ico', '.svg'},
-    'email': {'.eml', '.msg', '.mbox', '.pst'},
-    'archive': {'.zip', '.tar', '.gz', '.bz2', '.rar', '.7z'},
-    'remaining': {
+from typing import Set, Dict, FrozenSet
+
+_REGISTRY: Dict[str, FrozenSet[str]] = {
+    'pdf': frozenset({'.pdf'}),
+    'office': frozenset({'.docx', '.doc', '.xlsx', '.xls', '.csv', '.pptx', '.ppt'}),
+    'image': frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif', '.webp', '.ico', '.svg'}),
+    'email': frozenset({'.eml', '.msg', '.mbox', '.pst'}),
+    'archive': frozenset({'.zip', '.tar', '.gz', '.bz2', '.rar', '.7z'}),
+    'remaining': frozenset({
         '.json', '.xml', '.txt', '.yaml', '.yml', '.html', '.htm', '.bin', '.rtf',
         '.md', '.csv', '.log', '.ini', '.cfg'
-    }
+    })
 }
 
+# Bumped on every registration so callers can cache lookups built from the registry
+_version = 0
+
 
-def get_extensions_for(key: str) -> Set[str]:
-    """Return a set of extensions for the given reader key.
+def get_extensions_for(key: str) -> FrozenSet[str]:
+    """Return the (read-only) set of extensions for the given reader key.
 
     Common keys: 'pdf', 'office', 'image', 'email', 'archive', 'remaining'
     """
-    return _REGISTRY.get(key, set())
+    return _REGISTRY.get(key, frozenset())
+
+
+def get_registry_version() -> int:
+    """Return a counter that changes whenever extensions are registered."""
+    return _version
 
 
 def register_extensions(key: str, extensions: Set[str]):
     """Register or update extensions for a reader key."""
-    _REGISTRY[key] = set(extensions)
+    global _version
+    _REGISTRY[key] = frozenset(extensions)
+    _version += 1
@@ -8,7 +8,10 @@ import re
 import hashlib
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
+
+# Characters not allowed in filenames on Windows (plus control characters)
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
 
 
 def format_file_size(size_bytes: Optional[int]) -> str:
@@ -63,7 +66,7 @@ def sanitize_filename(filename: str) -> str:
     """
     if not filename:
         return "unnamed_attachment"
-    filename = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+    filename = _INVALID_FILENAME_CHARS.sub('_', filename)
     filename = filename.strip('. ')
     return filename if filename else "unnamed_attachment"
 
@@ -165,6 +168,45 @@ def get_standardized_metadata(file_path: str) -> Optional[Dict[str, Any]]:
         }
 
 
+def iter_tree(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Walk a directory tree, yielding file metadata as entries are found.
+    
+    Args:
+        path: Directory path
+        
+    Yields:
+        File metadata dictionaries
+    """
+    for entry_path in _walk_entries(path):
+        file_info = get_standardized_metadata(entry_path)
+        if file_info:
+            yield file_info
+
+
+def _walk_entries(path: str) -> Iterator[str]:
+    """
+    Yield the paths of all entries below path (like Path.rglob("*")).
+    
+    os.scandir returns the entry type with the directory listing, so folders
+    are recognised without an extra stat per entry; symlinked folders are not
+    followed and unreadable folders are skipped.
+    """
+    pending = [str(path)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    yield entry.path
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            continue
+
+
 def read_tree(path: str) -> list:
     """
     Read directory tree and return list of file metadata.
@@ -175,14 +217,7 @@ def read_tree(path: str) -> list:
     Returns:
         List of file metadata dictionaries
     """
-    file_info_list = []
-    
-    for p in Path(path).rglob("*"):
-        file_info = get_standardized_metadata(p)
-        if file_info:
-            file_info_list.append(file_info)
-    
-    return file_info_list
+    return list(iter_tree(path))
 
 
 def create_standardized_result(file_path: str, content_data: Any, 
@@ -5,6 +5,7 @@ No dependencies on other project modules.
 
 import os
 import json
+import atexit
 import threading
 import time
 from datetime import datetime
@@ -12,9 +13,16 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 
 
+# Buffered actions are written at least this often, or as soon as this many are queued
+FLUSH_INTERVAL = 0.1
+FLUSH_THRESHOLD = 64
+
+
 class ActionRecorder:
     """
-    Records command-line actions instantly to a log file.
+    Records command-line actions to a log file.
+    Entries are formatted when recorded and written in batches by a background
+    flusher (ERROR entries and full buffers are written immediately).
     Thread-safe singleton pattern for global access.
     Independent module with no external dependencies.
     """
@@ -38,6 +46,11 @@ class ActionRecorder:
         self.log_dir = Path("logs")
         self.log_dir.mkdir(exist_ok=True)
         self.file_lock = threading.Lock()
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._flusher = None
+        atexit.register(self.flush)
         self._initialized = True
     
     def start_recording(self, log_filename: Optional[str] = None) -> Path:
@@ -54,6 +67,8 @@ class ActionRecorder:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             log_filename = f"action_log_{timestamp}.txt"
         
+        # Entries recorded so far belong to the previous log file
+        self.flush()
         self.log_file = self.log_dir / log_filename
         
         # Write header
@@ -70,12 +85,13 @@ class ActionRecorder:
         """Stop recording actions"""
         if self.enabled and self.log_file:
             self.record_action("SYSTEM", "Recording stopped", {})
+            self.flush()
             self.enabled = False
     
     def record_action(self, action_type: str, description: str, 
                      details: Optional[Dict[str, Any]] = None, level: str = "INFO"):
         """
-        Record an action instantly.
+        Record an action (written by the background flusher within FLUSH_INTERVAL).
         
         Args:
             action_type: Type of action (USER_INPUT, FUNCTION_CALL, FILE_OP, ERROR, etc.)
@@ -104,15 +120,42 @@ class ActionRecorder:
             log_line += f"\n  Details: {details_str}"
         log_line += "\n" + "-" * 80 + "\n"
         
-        # Write instantly (thread-safe)
+        with self._buffer_lock:
+            self._buffer.append(log_line)
+            pending = len(self._buffer)
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop,
+                    name="ActionRecorderFlusher",
+                    daemon=True
+                )
+                self._flusher.start()
+        
+        if level == "ERROR" or pending >= FLUSH_THRESHOLD:
+            self.flush()
+    
+    def flush(self):
+        """Write all buffered actions to the log file (thread-safe)"""
+        # file_lock is held from taking the batch until it is written, so
+        # concurrent flushes cannot write batches out of order
         with self.file_lock:
+            with self._buffer_lock:
+                if not self._buffer:
+                    return
+                lines, self._buffer = self._buffer, []
+                log_file = self.log_file
+
             try:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_line)
-                    f.flush()  # Ensure immediate write
+                with open(log_file, 'a', encoding='utf-8') as f:
+                    f.write("".join(lines))
             except Exception:
                 # Silently fail if logging fails to avoid breaking the main app
                 pass
+    
+    def _flush_loop(self):
+        """Background flusher: write buffered actions every FLUSH_INTERVAL seconds"""
+        while not self._flush_event.wait(FLUSH_INTERVAL):
+            self.flush()
 
 
 # Global singleton instance
@@ -133,6 +176,11 @@ def record_command_line_action(action_type: str, description: str,
     recorder.record_action(action_type, description, details, level)
 
 
+def flush_action_recording():
+    """Write buffered actions to the log file now"""
+    recorder.flush()
+
+
 def start_action_recording(log_filename: Optional[str] = None) -> Path:
     """
     Start action recording.
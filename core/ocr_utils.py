@@ -4,37 +4,73 @@ Shared OCR utilities: tesseract configuration and preprocessing helper.
 This module relies on `core.library_utils.get_shared_libs()` to determine
 which optional modules are available.
 """
-from functools import lru_cache
-from typing import Tuple
+import threading
+from typing import Dict, Optional, Tuple
 
 from .library_utils import get_shared_libs
 
+# (lang_string, config_string) per requested language tuple. The lock makes
+# sure concurrent first calls spawn `tesseract --list-langs` only once.
+_config_cache: Dict[tuple, Tuple[str, str]] = {}
+_config_lock = threading.Lock()
+
+# Images with a longer side than this are downscaled before OCR. Tesseract
+# works best around 300 DPI; this still keeps a 300 DPI A4/Letter page whole
+OCR_MAX_SIDE = 3600
+
+# Languages of the tesseract installation, fetched once per process
+_available_langs: Optional[Tuple[str, ...]] = None
+_available_langs_lock = threading.Lock()
+
 
-@lru_cache(maxsize=4)
 def get_tesseract_config(languages=None) -> Tuple[str, str]:
     """Return (lang_string, config_string) for pytesseract.
 
     If pytesseract is unavailable returns default ('eng', '--oem 3 --psm 6').
     """
+    key = tuple(languages) if languages else ()
+    cached = _config_cache.get(key)
+    if cached is not None:
+        return cached
+    with _config_lock:
+        cached = _config_cache.get(key)
+        if cached is None:
+            cached = _config_cache[key] = _build_tesseract_config(languages)
+    return cached
+
+
+def _get_available_langs(pytesseract) -> Tuple[str, ...]:
+    """Return the installed tesseract languages (empty if they cannot be listed)"""
+    global _available_langs
+    if _available_langs is None:
+        with _available_langs_lock:
+            if _available_langs is None:
+                try:
+                    _available_langs = tuple(pytesseract.get_languages(config=""))
+                except Exception:
+                    _available_langs = ()
+    return _available_langs
+
+
+def _build_tesseract_config(languages) -> Tuple[str, str]:
+    """Uncached body of get_tesseract_config"""
     libs = get_shared_libs()
     pytesseract = libs.get('pytesseract')
 
     if not pytesseract:
         return 'eng', '--oem 3 --psm 6'
 
-    try:
-        available = pytesseract.get_languages(config="")
-    except Exception:
-        available = []
+    available = _get_available_langs(pytesseract)
+    available_set = frozenset(available)
 
     selected = []
     if languages:
         for lang in languages:
-            if lang in available:
+            if lang in available_set:
                 selected.append(lang)
 
     if not selected:
-        selected = ['eng'] if 'eng' in available else (available[:1] if available else ['eng'])
+        selected = ['eng'] if 'eng' in available_set else (list(available[:1]) if available else ['eng'])
 
     lang_str = '+'.join(selected)
     config = '--oem 3 --psm 6'
@@ -44,6 +80,7 @@ def get_tesseract_config(languages=None) -> Tuple[str, str]:
 def preprocess_for_ocr(img_array, libs=None):
     """Preprocess numpy image array for OCR using OpenCV if available.
 
+    Oversized images are first scaled down to OCR_MAX_SIDE on their longer side.
     Returns processed array. If cv2/np unavailable returns input unchanged.
     """
     if libs is None:
@@ -55,8 +92,14 @@ def preprocess_for_ocr(img_array, libs=None):
     if not cv2 or not np:
         return img_array
 
-    # Convert to grayscale if needed
     try:
+        height, width = img_array.shape[:2]
+        longest = max(height, width)
+        if longest > OCR_MAX_SIDE:
+            scale = OCR_MAX_SIDE / longest
+            img_array = cv2.resize(img_array, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        # Convert to grayscale if needed
         if len(img_array.shape) == 3:
             gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
         else:
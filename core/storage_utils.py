@@ -2,12 +2,46 @@
 Utilities for recursively storing extracted files via the storage pipeline.
 
 This module provides a single function `recursively_store_extracted` which
-walks the `result` structure produced by readers, adds extracted/attachment
-results via a caller-provided `add_result_fn` (if any), and calls
-`storage_pipeline.store_file_complete` for each extracted file. It returns
+walks (and prunes) the `result` structure produced by readers, adds extracted/attachment
+results via a caller-provided `add_result_fn` (if any), and stores each
+nesting depth with one `storage_pipeline.store_files_bulk` call (falling
+back to `store_file_complete` per file). It returns
 summary counts so callers can update their own statistics.
 """
-from typing import Callable, Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
+
+
+def _extracted_children(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Archive extracted files and email attachments of a result."""
+    if not result or not isinstance(result, dict):
+        return []
+
+    content = result.get('Content', {})
+    if not isinstance(content, dict):
+        return []
+    # Most results are leaf files
+    if 'extracted_files' not in content and 'attachments' not in content:
+        return []
+
+    children = []
+    if 'extracted_files' in content and isinstance(content['extracted_files'], list):
+        children.extend(content['extracted_files'])
+    attachments = content.get('attachments')
+    if attachments and isinstance(attachments, dict):
+        if 'extracted_files' in attachments and isinstance(attachments['extracted_files'], list):
+            children.extend(attachments['extracted_files'])
+    return children
+
+
+def _release_children(result: Dict[str, Any]) -> None:
+    """Drop the nested extracted file lists of a result once they are queued."""
+    content = result.get('Content')
+    if not isinstance(content, dict):
+        return
+    content.pop('extracted_files', None)
+    attachments = content.get('attachments')
+    if isinstance(attachments, dict):
+        attachments.pop('extracted_files', None)
 
 
 def recursively_store_extracted(
@@ -17,10 +51,19 @@ def recursively_store_extracted(
     add_result_fn: Optional[Callable[[Dict[str, Any]], None]] = None,
     logger=None
 ) -> Dict[str, int]:
-    """Recursively store extracted files and attachments.
+    """Store extracted files and attachments at every nesting depth.
+
+    The tree is walked breadth-first: all files of one depth (across every
+    parent) are stored in a single bulk call, then their children form the
+    next depth.
+
+    The walk mutates `result`: once the children of a result are queued its
+    'extracted_files' lists are removed, so subtrees that were already handed
+    to storage (and to `add_result_fn`) can be freed instead of staying alive
+    until the whole tree is stored.
 
     Args:
-        storage_pipeline: instance with `store_file_complete` and `get_statistics`
+        storage_pipeline: instance with `store_files_bulk` and/or `store_file_complete`
         result: processing result dict (should contain 'Metadata' and 'Content')
         parent_path_id: optional parent path id for storage
         add_result_fn: optional callback to add a result to caller's results list
@@ -31,63 +74,59 @@ def recursively_store_extracted(
     """
     counts = {'stored': 0, 'duplicates': 0, 'errors': 0, 'processed': 0}
 
-    if not result or not isinstance(result, dict):
-        return counts
-
-    content = result.get('Content', {})
-    if not isinstance(content, dict):
-        return counts
-
-    # Helper to store a single extracted_result
-    def _store_one(extracted_result: Dict[str, Any], parent_id: Optional[int] = parent_path_id):
-        nonlocal counts
-
-        if not isinstance(extracted_result, dict) or not extracted_result.get('Metadata'):
-            return
-
-        extracted_file_info = extracted_result.get('Metadata', {})
-        extracted_content = extracted_result.get('Content', {})
+    level = [(result, parent_path_id)]
+    while level:
+        # (file_info, result, parent_path_id) for every file of this depth
+        pending = []
+        for parent_result, parent_id in level:
+            for extracted_result in _extracted_children(parent_result):
+                if not isinstance(extracted_result, dict) or not extracted_result.get('Metadata'):
+                    continue
+
+                # Let caller track results
+                if add_result_fn:
+                    try:
+                        add_result_fn(extracted_result)
+                    except Exception:
+                        # ignore failures in callback
+                        pass
+
+                counts['processed'] += 1
+                pending.append((extracted_result['Metadata'], extracted_result, parent_id))
+            _release_children(parent_result)
+
+        if not pending:
+            break
 
-        # Let caller track results
-        if add_result_fn:
-            try:
-                add_result_fn(extracted_result)
-            except Exception:
-                # ignore failures in callback
-                pass
-
-        counts['processed'] += 1
-
-        # Detect extraction failure
-        is_extraction_failure = isinstance(extracted_content, dict) and bool(extracted_content.get('error'))
-
-        # Attempt to store via storage pipeline
         try:
-            storage_response = storage_pipeline.store_file_complete(
-                extracted_file_info,
-                extracted_result,
-                parent_path_id=parent_id,
-                hierarchy_path=None,
-                use_async=False
-            )
+            if hasattr(storage_pipeline, 'store_files_bulk'):
+                responses = storage_pipeline.store_files_bulk(pending, use_async=True)
+            else:
+                responses = [
+                    storage_pipeline.store_file_complete(
+                        extracted_file_info,
+                        extracted_result,
+                        parent_path_id=parent_id,
+                        hierarchy_path=None,
+                        use_async=True
+                    )
+                    for extracted_file_info, extracted_result, parent_id in pending
+                ]
+        except Exception as e:
+            counts['errors'] += len(pending)
+            if logger:
+                try:
+                    logger.error(f"Error storing extracted files: {e}")
+                except Exception:
+                    pass
+            break
 
+        # Children of stored files make up the next depth, under their new path_id
+        level = []
+        for (_, extracted_result, _), storage_response in zip(pending, responses):
             if hasattr(storage_response, 'is_success') and storage_response.is_success:
                 counts['stored'] += 1
-                # Recurse into nested extracted files using returned path_id
-                try:
-                    child_parent_id = getattr(storage_response, 'path_id', None)
-                except Exception:
-                    child_parent_id = None
-                # Recurse
-                child_counts = recursively_store_extracted(
-                    storage_pipeline,
-                    extracted_result,
-                    parent_path_id=child_parent_id,
-                    add_result_fn=add_result_fn,
-                    logger=logger
-                )
-                for k, v in child_counts.items():
-                    counts[k] += v
+                level.append((extracted_result, getattr(storage_response, 'path_id', None)))
 
             elif hasattr(storage_response, 'is_duplicate') and storage_response.is_duplicate:
                 counts['duplicates'] += 1
@@ -95,24 +134,4 @@ def recursively_store_extracted(
                 # Treat as error
                 counts['errors'] += 1
 
-        except Exception as e:
-            counts['errors'] += 1
-            if logger:
-                try:
-                    logger.error(f"Error storing extracted file: {e}")
-                except Exception:
-                    pass
-
-    # Process archive extracted files
-    if 'extracted_files' in content and isinstance(content['extracted_files'], list):
-        for extracted in content['extracted_files']:
-            _store_one(extracted, parent_path_id)
-
-    # Process email attachments
-    attachments = content.get('attachments')
-    if attachments and isinstance(attachments, dict):
-        if 'extracted_files' in attachments and isinstance(attachments['extracted_files'], list):
-            for attachment_result in attachments['extracted_files']:
-                _store_one(attachment_result, parent_path_id)
-
     return counts
@@ -72,6 +72,10 @@ class StoragePipeline:
         self.enable_concurrency = enable_concurrency
         self.max_workers = max_workers
         
+        # Detail writes (content/title/status) still running after use_async=True
+        self._pending_details = set()
+        self._pending_details_lock = threading.Lock()
+        
         # Get source and side IDs
         self.source_id = self.hub.source_operations.get_or_create_source(source_name)
         self.side_id = self.hub.side_operations.get_or_create_side(side_name)
@@ -144,10 +148,15 @@ class StoragePipeline:
         """
         Complete file storage pipeline with detailed result tracking
         
+        With use_async=True (and concurrency enabled) the call returns once the
+        hash and metadata rows exist; content, title and status are written on
+        the thread executor (see wait_for_pending()).
+        
         Returns StorageResponse instead of Optional[int] for better error handling
         """
         import logging
         logger = logging.getLogger(__name__)
+        debug = logger.isEnabledFor(logging.DEBUG)
         lock = self.stats_lock if self.enable_concurrency else threading.Lock()
         
         file_name = file_info.get('name', 'unknown')
@@ -198,7 +207,8 @@ class StoragePipeline:
             # 2. Check duplicate with CLEAR distinction
             is_duplicate, existing_path_id = self.check_duplicate(file_hash)
             if is_duplicate:
-                logger.debug(f"⭐️ Skipping duplicate: {file_name} (existing path_id: {existing_path_id})")
+                if debug:
+                    logger.debug(f"⭐️ Skipping duplicate: {file_name} (existing path_id: {existing_path_id})")
                 with lock:
                     if self.enable_concurrency:
                         self.stats["duplicates"] += 1
@@ -259,62 +269,30 @@ class StoragePipeline:
                     error_message="Metadata storage returned None"
                 )
             
-            # 5. Extract and store content
-            content = result.get('Content', {})
-            has_readable_content = False
-            
-            if isinstance(content, dict):
-                if 'error' not in content:
-                    text = self._extract_text_from_content(content)
-                    if text and len(text.strip()) > 0:
-                        has_readable_content = True
-                        try:
-                            if self.enable_concurrency and len(text) > 100000:
-                                # Large content - use pool
-                                task_id = self.pool_manager.submit_task(
-                                    self.storage_pool_id,
-                                    self._store_content_pipeline,
-                                    (text, path_id),
-                                    {}
-                                )
-                            else:
-                                self._store_content_pipeline(text, path_id)
-                        except Exception as content_error:
-                            logger.warning(f"Content storage failed for {file_name}: {content_error}")
-                            # Don't fail the entire operation for content storage failure
-            
-            # 6. Store title
-            try:
-                title = self._extract_title(result, file_info)
-                if title:
-                    # Extract actual parent path ID if it's a StorageResponse
-                    actual_parent_id = None
-                    if parent_path_id is not None:
-                        if hasattr(parent_path_id, 'path_id'):  # StorageResponse object
-                            actual_parent_id = parent_path_id.path_id
-                        elif isinstance(parent_path_id, int):
-                            actual_parent_id = parent_path_id
-                    
-                    self._store_title_pipeline(title, path_id, actual_parent_id)
-            except Exception as title_error:
-                logger.warning(f"Title storage failed for {file_name}: {title_error}")
-                # Don't fail the entire operation for title storage failure
-                # Don't fail the entire operation for title storage failure
-            
-            # 7. Update file status
-            file_status = 'Read' if has_readable_content else 'Unread'
-            try:
-                self.hub.path_operations.update_file_status(path_id, file_status)
-            except Exception as status_error:
-                logger.warning(f"Failed to update file status for {file_name}: {status_error}")
-                # Continue anyway - status update is not critical
+            # 5-7. Content, title and status only need path_id, so with use_async
+            # they are written in the background and the caller gets path_id now
+            if use_async and self.enable_concurrency:
+                detail_future = self.thread_executor.submit(
+                    self._store_file_details, file_info, result, path_id, parent_path_id
+                )
+                with self._pending_details_lock:
+                    self._pending_details.add(detail_future)
+                detail_future.add_done_callback(self._discard_pending_detail)
+                file_status = 'Queued'
+                has_readable_content = True
+            else:
+                has_readable_content = self._store_file_details(
+                    file_info, result, path_id, parent_path_id
+                )
+                file_status = 'Read' if has_readable_content else 'Unread'
             
             with lock:
                 if self.enable_concurrency:
                     self.stats["completed"] += 1
             
             status_icon = "✓" if has_readable_content else "⚠"
-            logger.debug(f"{status_icon} Stored {file_name} (path_id: {path_id}, status: {file_status})")
+            if debug:
+                logger.debug(f"{status_icon} Stored {file_name} (path_id: {path_id}, status: {file_status})")
             
             return StorageResponse(
                 result=StorageResult.SUCCESS,
@@ -333,6 +311,86 @@ class StoragePipeline:
         
         
         
+    def _store_file_details(
+        self,
+        file_info: Dict[str, Any],
+        result: Dict[str, Any],
+        path_id: int,
+        parent_path_id: Optional[int] = None
+    ) -> bool:
+        """
+        Store content, title and file status of an already stored path
+        
+        Returns:
+            True if readable content was found
+        """
+        import logging
+        logger = logging.getLogger(__name__)
+        file_name = file_info.get('name', 'unknown')
+        
+        # 5. Extract and store content
+        content = result.get('Content', {})
+        has_readable_content = False
+
+        if isinstance(content, dict):
+            if 'error' not in content:
+                text = self._extract_text_from_content(content)
+                if text and len(text.strip()) > 0:
+                    has_readable_content = True
+                    try:
+                        if self.enable_concurrency and len(text) > 100000:
+                            # Large content - use pool
+                            task_id = self.pool_manager.submit_task(
+                                self.storage_pool_id,
+                                self._store_content_pipeline,
+                                (text, path_id),
+                                {}
+                            )
+                        else:
+                            self._store_content_pipeline(text, path_id)
+                    except Exception as content_error:
+                        logger.warning(f"Content storage failed for {file_name}: {content_error}")
+                        # Don't fail the entire operation for content storage failure
+
+        # 6. Store title
+        try:
+            title = self._extract_title(result, file_info)
+            if title:
+                # Extract actual parent path ID if it's a StorageResponse
+                actual_parent_id = None
+                if parent_path_id is not None:
+                    if hasattr(parent_path_id, 'path_id'):  # StorageResponse object
+                        actual_parent_id = parent_path_id.path_id
+                    elif isinstance(parent_path_id, int):
+                        actual_parent_id = parent_path_id
+
+                self._store_title_pipeline(title, path_id, actual_parent_id)
+        except Exception as title_error:
+            logger.warning(f"Title storage failed for {file_name}: {title_error}")
+            # Don't fail the entire operation for title storage failure
+
+        # 7. Update file status
+        file_status = 'Read' if has_readable_content else 'Unread'
+        try:
+            self.hub.path_operations.update_file_status(path_id, file_status)
+        except Exception as status_error:
+            logger.warning(f"Failed to update file status for {file_name}: {status_error}")
+            # Continue anyway - status update is not critical
+        
+        return has_readable_content
+    
+    def _discard_pending_detail(self, future):
+        with self._pending_details_lock:
+            self._pending_details.discard(future)
+    
+    def wait_for_pending(self, timeout: Optional[float] = None):
+        """Wait for content/title/status writes deferred by use_async=True"""
+        with self._pending_details_lock:
+            pending = list(self._pending_details)
+        if pending:
+            from concurrent.futures import wait
+            wait(pending, timeout=timeout)
+    
     def _retry_with_backoff(
         self,
         operation: Callable,
@@ -403,6 +461,7 @@ class StoragePipeline:
         """Synchronous file storage implementation"""
         import logging
         logger = logging.getLogger(__name__)
+        debug = logger.isEnabledFor(logging.DEBUG)
         lock = self.stats_lock if self.enable_concurrency else threading.Lock()
         
         file_name = file_info.get('name', 'unknown')
@@ -437,7 +496,8 @@ class StoragePipeline:
             # 2. Check duplicate
             is_duplicate, existing_path_id = self.check_duplicate(file_hash)
             if is_duplicate:
-                logger.debug(f"⏭️ Skipping duplicate: {file_name} (existing path_id: {existing_path_id})")
+                if debug:
+                    logger.debug(f"⏭️ Skipping duplicate: {file_name} (existing path_id: {existing_path_id})")
                 with lock:
                     if self.enable_concurrency:
                         self.stats["duplicates"] += 1
@@ -518,7 +578,8 @@ class StoragePipeline:
                     self.stats["completed"] += 1
             
             status_icon = "✓" if has_readable_content else "⚠"
-            logger.debug(f"{status_icon} Stored {file_name} (path_id: {path_id}, status: {file_status})")
+            if debug:
+                logger.debug(f"{status_icon} Stored {file_name} (path_id: {path_id}, status: {file_status})")
             return path_id
         except Exception as e:
             logger.error(f"✗ Storage pipeline error for {file_name}: {e}", exc_info=True)
@@ -859,6 +920,64 @@ class StoragePipeline:
         
         return results
     
+    def store_files_bulk(
+        self,
+        files_data: List[Tuple],
+        parent_path_id: Optional[int] = None,
+        use_async: bool = False
+    ) -> List[StorageResponse]:
+        """
+        Store a block of files through the complete storage pipeline
+        
+        The block is spread over the storage thread executor so the database
+        round-trips overlap instead of running back to back on the caller.
+        
+        Args:
+            files_data: List of (file_info, result) tuples, or
+                (file_info, result, parent_path_id) to give a file its own parent
+            parent_path_id: Optional parent path ID for files without their own
+            use_async: Passed on to store_file_complete
+            
+        Returns:
+            List of StorageResponse, aligned with files_data
+        """
+        if not files_data:
+            return []
+        
+        files_data = [
+            item if len(item) == 3 else (item[0], item[1], parent_path_id)
+            for item in files_data
+        ]
+        
+        if not self.enable_concurrency or len(files_data) == 1:
+            return [
+                self.store_file_complete(file_info, result, parent_path_id=file_parent_id, use_async=use_async)
+                for file_info, result, file_parent_id in files_data
+            ]
+        
+        futures = [
+            self.thread_executor.submit(
+                self.store_file_complete,
+                file_info,
+                result,
+                file_parent_id,
+                None,
+                use_async
+            )
+            for file_info, result, file_parent_id in files_data
+        ]
+        
+        responses = []
+        for future in futures:
+            try:
+                responses.append(future.result())
+            except Exception as e:
+                responses.append(StorageResponse(
+                    result=StorageResult.ERROR,
+                    error_message=f"Unexpected error: {str(e)}"
+                ))
+        return responses
+    
     def get_statistics(self) -> Dict[str, int]:
         """Get storage statistics"""
         if self.enable_concurrency:
@@ -870,6 +989,7 @@ class StoragePipeline:
         """Shutdown concurrency managers"""
         if self.enable_concurrency:
             if self.thread_executor:
+                self.wait_for_pending()
                 self.thread_executor.shutdown(wait=True)
             if self.pool_manager:
                 self.pool_manager.shutdown()
@@ -882,4 +1002,4 @@ class StoragePipeline:
     
     def flush_all(self):
         """Flush any pending operations"""
-        pass  # BatchPipeline handles this
\ No newline at end of file
+        self.wait_for_pending()  # BatchPipeline handles the word/hash batches
\ No newline at end of file
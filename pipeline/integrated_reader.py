@@ -13,21 +13,22 @@ while keeping all your existing reader functions unchanged.
 import os
 import time
 import threading
+import traceback
 from pathlib import Path
-from typing import List, Dict, Optional
-from queue import Queue, Empty
+from collections import Counter, deque
+from typing import Any, Callable, List, Dict, NamedTuple, Optional, Tuple
+from queue import Queue, Empty, SimpleQueue
 import sys
 from tqdm import tqdm
-from concurrent.futures import TimeoutError
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, wait, ALL_COMPLETED
 
-# Add this import with other core imports
-from core.storage_utils import recursively_store_extracted
-# Add parent directory to path
+# Add parent directory to path (only when running outside an installed package)
 parent_dir = Path(__file__).parent.parent
 if str(parent_dir) not in sys.path:
     sys.path.insert(0, str(parent_dir))
 
 
+from core.storage_utils import recursively_store_extracted
 from reader.main_specify_method import main_specify_method_of_reading_the_file
 from core.file_utils import (
     get_standardized_metadata,
@@ -39,7 +40,8 @@ from core.time_utils import (
 )
 
 from core.logging_utils import (
-    record_command_line_action
+    record_command_line_action,
+    flush_action_recording
 )
 
 # Import all four concurrency managers
@@ -51,7 +53,9 @@ from core.concurrency import (
     ProcessManager,
     ProcessPriority,
     AsyncManager,
-    TaskPriority
+    TaskPriority,
+    PoolState,
+    hub
 )
 
 
@@ -64,6 +68,131 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _debug_enabled() -> bool:
+    """
+    True when debug logging is on; per-file debug messages and error
+    tracebacks are only formatted then (f-strings are not lazy)
+    """
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+# Base scheduling priority by file type (processing speed); lower runs first
+_EXTENSION_PRIORITY = {
+    **dict.fromkeys(('.txt', '.json', '.xml', '.csv', '.yaml', '.yml'), 1),  # Fast text processing
+    **dict.fromkeys(('.docx', '.xlsx', '.pptx', '.doc', '.xls', '.ppt'), 3),  # Moderate office processing
+    '.pdf': 5,  # PDF with possible OCR
+    **dict.fromkeys(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'), 7),  # Image OCR (slow)
+    **dict.fromkeys(('.zip', '.rar', '.7z', '.tar', '.gz', '.eml', '.msg', '.pst'), 9),  # Archive extraction (creates more work)
+}
+_DEFAULT_PRIORITY = 5
+
+# Small text files are grouped into batches handled by one worker
+_BATCH_EXTENSIONS = frozenset({'.txt', '.json', '.xml', '.csv'})
+_BATCH_MAX_BYTES = 100 * 1024  # < 100KB
+
+# Completed results are handed to the storage pipeline in blocks of this size
+_STORAGE_BULK_SIZE = 50
+
+# Folder summary, rendered with a single %-format per folder
+_SUMMARY_RULE = "=" * 70
+_SUMMARY_TEMPLATE = "\n".join([
+    _SUMMARY_RULE,
+    "FOLDER PROCESSING SUMMARY",
+    _SUMMARY_RULE,
+    "Original Files:          %d",
+    "Extracted Files:         %d",
+    "Total Files Processed:   %d",
+    "Successful:              %d",
+    "Failed:                  %d",
+    "Success Rate:            %.1f%%",
+    "Total Time:              %.2fs",
+    "%s",
+    "%s%s",
+    _SUMMARY_RULE + "\n",
+])
+
+class StatsSnapshot(NamedTuple):
+    """Immutable copy of the processing counters, safe to read without stats_lock"""
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    in_progress: int = 0
+    start_time: Optional[float] = None  # time.monotonic() values
+    end_time: Optional[float] = None
+    original_files: int = 0
+    extracted_files: int = 0
+
+
+class _RollingCounter:
+    """Success/failure counts over a sliding time window split into fixed buckets"""
+    
+    def __init__(self, window_seconds: float, buckets: int = 10):
+        self.bucket_seconds = window_seconds / buckets
+        self._buckets = [[0, 0] for _ in range(buckets)]  # [successes, failures]
+        self._newest = 0  # Absolute index of the newest bucket
+    
+    def _advance(self, now: float) -> int:
+        """Zero the buckets that fell out of the window and return the current index"""
+        index = int(now / self.bucket_seconds)
+        expired = index - self._newest
+        if expired > 0:
+            buckets = self._buckets
+            for i in range(self._newest + 1, self._newest + 1 + min(expired, len(buckets))):
+                bucket = buckets[i % len(buckets)]
+                bucket[0] = bucket[1] = 0
+            self._newest = index
+        return index
+    
+    def record(self, failed: bool, count: int = 1, now: Optional[float] = None):
+        index = self._advance(time.monotonic() if now is None else now)
+        self._buckets[index % len(self._buckets)][1 if failed else 0] += count
+    
+    def totals(self, now: Optional[float] = None):
+        """(successes, failures) within the window"""
+        self._advance(time.monotonic() if now is None else now)
+        successes = failures = 0
+        for bucket_successes, bucket_failures in self._buckets:
+            successes += bucket_successes
+            failures += bucket_failures
+        return successes, failures
+    
+    def reset(self):
+        for bucket in self._buckets:
+            bucket[0] = bucket[1] = 0
+
+
+def _error_result(file_info: Dict, message: str) -> Dict:
+    """Result for a file that could not be processed (same shape as reader results)"""
+    return {"Metadata": file_info, "Content": {"error": message}}
+
+
+def _is_failure(result: Optional[Dict]) -> bool:
+    """True if a processing result carries an error"""
+    content = result.get("Content") if result else None
+    return bool(content and content.get("error"))
+
+
+def _pool_worker(file_path: str, depth: int = 0) -> Dict:
+    """
+    Multiprocessing pool entry point.
+
+    Only the file path crosses the process boundary; metadata is rebuilt
+    locally in the worker so the pickled task payload stays small.
+    """
+    file_info = get_standardized_metadata(file_path)
+    try:
+        result = main_specify_method_of_reading_the_file(
+            file_info,
+            collect=True,
+            depth=depth
+        )
+    except Exception as e:
+        return _error_result(file_info, str(e))
+    if result is None:
+        result = _error_result(file_info, "File processing returned None")
+    return result
+
+
 class IntegratedFileReader:
     """
     Multi-concurrency file reader that uses all four concurrency managers
@@ -93,12 +222,21 @@ class IntegratedFileReader:
                 time.sleep(1)
     """
     
+    # Pool ids handed out per shared MultiprocessingManager, so readers that
+    # reuse the hub's managers also reuse its worker processes
+    _shared_pool_ids: Dict[int, str] = {}
+    _shared_lock = threading.Lock()
+    
     def __init__(self, 
                 max_workers: int = 4,
                 enable_monitoring: bool = True,
                 monitor_interval: float = 5.0,
                 failure_threshold: int = 100,  # Increased from 5
                 failure_window: int = 200,     # Increased from 10
+                failure_window_seconds: float = 60.0,
+                breaker_cooldown: float = 30.0,
+                failure_rate_threshold: float = 0.5,
+                minimum_throughput: Optional[int] = None,
                 use_priority: bool = True,
                 enable_storage: bool = False,
                 storage_source: str = "default",
@@ -106,7 +244,8 @@ class IntegratedFileReader:
                 thread_manager: ThreadManager = None,
                 pool_manager: MultiprocessingManager = None,
                 process_manager: ProcessManager = None,
-                async_manager: AsyncManager = None):
+                async_manager: AsyncManager = None,
+                share_managers: bool = True):
         """
         Initialize the multi-concurrency file reader
         
@@ -114,35 +253,62 @@ class IntegratedFileReader:
             max_workers: Number of parallel workers (default: 4)
             enable_monitoring: Enable health monitoring (default: True)
             monitor_interval: Monitoring interval in seconds (default: 5.0)
-            failure_threshold: Number of failures to trigger circuit breaker (default: 5)
-            failure_window: Window size for failure tracking (default: 10)
+            failure_threshold: Default for minimum_throughput (default: 100)
+            failure_window: Number of recent outcomes kept for reporting (x2) (default: 200)
+            failure_window_seconds: Sliding time window the failure rate is measured over (default: 60.0)
+            breaker_cooldown: Seconds the breaker stays open before a half-open probe (default: 30.0)
+            failure_rate_threshold: Fraction of processing failures in the window
+                that opens the circuit breaker (default: 0.5)
+            minimum_throughput: Files that must complete within the window before
+                the failure rate is trusted (default: failure_threshold)
             use_priority: Enable priority-based scheduling (default: True)
+            share_managers: Use the process-wide managers from shared_managers()
+                for any manager not passed explicitly (default: True)
         """
         self.max_workers = max_workers
         self.enable_monitoring = enable_monitoring
         self.monitor_interval = monitor_interval
         self.failure_threshold = failure_threshold
         self.failure_window = failure_window
+        self.failure_window_seconds = failure_window_seconds
+        self.breaker_cooldown = breaker_cooldown
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_throughput = failure_threshold if minimum_throughput is None else minimum_throughput
         self.use_priority = use_priority
         self.enable_storage = enable_storage
         self.storage_source = storage_source
         self.storage_side = storage_side
         
-        # Initialize all four concurrency managers (allow re-use from hub)
-        self.thread_manager = thread_manager or ThreadManager()
-        self.pool_manager = pool_manager or MultiprocessingManager()
-        self.process_manager = process_manager or ProcessManager()
-        self.async_manager = async_manager or AsyncManager()
+        # Initialize all four concurrency managers (allow re-use from hub).
+        # Shared managers belong to the hub and are torn down by hub.shutdown_all();
+        # they are looked up on first use, since the hub starts their monitors
+        # (and the async event loop) when it creates them
         self._owns_managers = {
-            "thread": thread_manager is None,
-            "pool": pool_manager is None,
-            "process": process_manager is None,
-            "async": async_manager is None,
+            "thread": thread_manager is None and not share_managers,
+            "pool": pool_manager is None and not share_managers,
+            "process": process_manager is None and not share_managers,
+            "async": async_manager is None and not share_managers,
+        }
+        self._managers = {
+            "thread": thread_manager or (None if share_managers else ThreadManager()),
+            "pool": pool_manager or (None if share_managers else MultiprocessingManager()),
+            "process": process_manager or (None if share_managers else ProcessManager()),
+            "async": async_manager or (None if share_managers else AsyncManager()),
         }
+        # Managed threads started by this reader (a shared ThreadManager also
+        # runs other readers' threads)
+        self._thread_ids = set()
         
         # Storage pipeline (lazy initialization)
         self.storage_pipeline = None
         self.batch_pipeline = None
+        # Bulk storage blocks run here so the coordinator keeps draining completions
+        self._storage_executor = None
+        self._storage_futures = []
+        # Extracted files of stored parents are stored in a separate stage so a
+        # storage worker can move on to the next block of parents
+        self._extract_executor = None
+        self._extract_futures = []
         
         # Processing state
         self.is_initialized = False
@@ -152,8 +318,15 @@ class IntegratedFileReader:
         self.monitor_task_id = None
         
         # Results and statistics
+        # Producers put results on a lock-free queue; the coordinator drains it into self.results
         self.results = []
         self.results_lock = threading.Lock()
+        self._results_queue = SimpleQueue()
+        # Read-only copy handed out by get_results(), rebuilt only when results grew
+        self._results_snapshot = ()
+        # Original (non-extracted) results, tallied as they are added
+        self._original_count = 0
+        self._original_names = set()
         self.stats = {
             "total": 0,
             "completed": 0,
@@ -163,9 +336,17 @@ class IntegratedFileReader:
             "end_time": None
         }
         self.stats_lock = threading.Lock()
-        
-        # Circuit breaker
-        self.recent_failures = []
+        # Writers update self.stats under stats_lock and then publish a snapshot;
+        # readers take the snapshot reference without locking
+        self._stats_snapshot = StatsSnapshot(**self.stats)
+        self._outstanding = 0  # Submitted tasks not yet handled by the coordinator
+        
+        # Circuit breaker (closed -> open -> half_open -> closed/open)
+        self.recent_failures = deque(maxlen=failure_window * 2)  # Last outcomes, for reporting
+        self._recent_failure_count = 0  # Processing errors currently in recent_failures
+        self._outcomes = _RollingCounter(failure_window_seconds)
+        self._breaker_state = "closed"
+        self._open_until = 0.0
         
         logger.info(f"IntegratedFileReader initialized with {max_workers} workers, priority={'enabled' if use_priority else 'disabled'}")
         record_command_line_action(
@@ -176,43 +357,95 @@ class IntegratedFileReader:
                 "monitoring_enabled": enable_monitoring,
                 "failure_threshold": failure_threshold,
                 "failure_window": failure_window,
+                "failure_rate_threshold": failure_rate_threshold,
                 "priority_enabled": use_priority
             }
         )
         
-    class ThreadTask:
-        """Lightweight Future-like adapter backed by ThreadManager threads."""
-        def __init__(self, name: str, priority: ThreadPriority):
-            self.name = name
-            self.priority = priority
-            self.thread_id: Optional[str] = None
-            self._event = threading.Event()
-            self._result: Any = None
-            self._exception: Optional[BaseException] = None
+    @classmethod
+    def shared_managers(cls) -> Dict[str, Any]:
+        """
+        Get the process-wide concurrency managers (created lazily by the hub)
 
-        def set_result(self, result: Any):
-            self._result = result
-            self._event.set()
+        Returns:
+            Dictionary with 'thread', 'pool', 'process' and 'async' managers
+        """
+        return {
+            "thread": hub.thread_mgr,
+            "pool": hub.pool_mgr,
+            "process": hub.process_mgr,
+            "async": hub.async_mgr,
+        }
+
+    def _manager(self, kind: str):
+        """Get a concurrency manager, taking it from the hub on first use when shared"""
+        manager = self._managers[kind]
+        if manager is None:
+            manager = self._managers[kind] = getattr(hub, f"{kind}_mgr")
+        return manager
+
+    def _resolved_managers(self) -> Dict[str, Any]:
+        """Managers this reader has created or already taken from the hub"""
+        return {kind: manager for kind, manager in self._managers.items() if manager is not None}
+
+    @property
+    def thread_manager(self) -> ThreadManager:
+        """ThreadManager used by this reader"""
+        return self._manager("thread")
 
-        def set_exception(self, exc: BaseException):
-            self._exception = exc
-            self._event.set()
+    @property
+    def pool_manager(self) -> MultiprocessingManager:
+        """MultiprocessingManager used by this reader"""
+        return self._manager("pool")
 
-        def done(self) -> bool:
-            return self._event.is_set()
+    @property
+    def process_manager(self) -> ProcessManager:
+        """ProcessManager used by this reader"""
+        return self._manager("process")
+
+    @property
+    def async_manager(self) -> AsyncManager:
+        """AsyncManager used by this reader"""
+        return self._manager("async")
+
+    def _get_or_create_pool(self, worker_count: int) -> str:
+        """Create the CPU pool, or reuse the one already running on a shared manager"""
+        if self._owns_managers.get("pool", False):
+            return self.pool_manager.create_pool(
+                name="CPUIntensiveProcessing",
+                worker_count=worker_count,
+                priority=PoolPriority.NORMAL
+            )
+        
+        with self._shared_lock:
+            key = id(self.pool_manager)
+            pool_id = self._shared_pool_ids.get(key)
+            pool = self.pool_manager.pools.get(pool_id) if pool_id else None
+            if pool is None or pool.metrics.state != PoolState.RUNNING:
+                pool_id = self.pool_manager.create_pool(
+                    name="CPUIntensiveProcessing",
+                    worker_count=worker_count,
+                    priority=PoolPriority.NORMAL
+                )
+                self._shared_pool_ids[key] = pool_id
+            return pool_id
 
-        def result(self, timeout: Optional[float] = None) -> Any:
-            if not self._event.wait(timeout):
-                raise TimeoutError(f"Thread task '{self.name}' timed out")
-            if self._exception:
-                raise self._exception
-            return self._result
+    class ThreadTask(Future):
+        """concurrent.futures.Future backed by a ThreadManager thread, so wait()/as_completed() apply."""
+        def __init__(self, name: str, priority: ThreadPriority):
+            super().__init__()
+            self.name = name
+            self.priority = priority
+            self.thread_id: Optional[str] = None
+            self.context: Any = None  # Caller data read back on completion
 
     def _submit_thread_task(self, func: Callable, *args, priority: ThreadPriority = ThreadPriority.NORMAL, **kwargs) -> "ThreadTask":
         """Submit a callable to run on a managed thread with priority tracking."""
         task = self.ThreadTask(name=getattr(func, "__name__", "thread_task"), priority=priority)
 
         def _runner():
+            if not task.set_running_or_notify_cancel():
+                return
             try:
                 res = func(*args, **kwargs)
                 task.set_result(res)
@@ -229,18 +462,10 @@ class IntegratedFileReader:
             auto_start=True
         )
         task.thread_id = thread_id
+        self._thread_ids.add(thread_id)
+        task.add_done_callback(lambda _task: self._thread_ids.discard(thread_id))
         return task
 
-    def _as_completed_thread_tasks(self, tasks: List["ThreadTask"], timeout: float = 0.5) -> List["ThreadTask"]:
-        """Return tasks that completed within timeout (polling-based)."""
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            done = [t for t in tasks if t.done()]
-            if done:
-                return done
-            time.sleep(0.01)
-        return [t for t in tasks if t.done()]
-
     def initialize(self):
         """Initialize all four concurrency managers"""
         if self.is_initialized:
@@ -250,40 +475,33 @@ class IntegratedFileReader:
             logger.info("Initializing all concurrency managers...")
             
             # Initialize AsyncManager first (needs event loop)
-            if self.async_manager and self._owns_managers.get("async", False):
+            if self._owns_managers.get("async", False):
                 self.async_manager.initialize()
             
             # Create multiprocessing pool for CPU-intensive tasks (large files, PDFs, images)
-            pool_workers = min(self.max_workers, 4)  # Limit process workers
-            self.pool_pool_id = self.pool_manager.create_pool(
-                name="CPUIntensiveProcessing",
-                worker_count=pool_workers,
-                priority=PoolPriority.NORMAL
-            )
+            # Limit process workers to half the cores to keep memory in check
+            pool_workers = max(1, min(self.max_workers, 4, (os.cpu_count() or 2) // 2))
+            self.pool_pool_id = self._get_or_create_pool(pool_workers)
             
-            # Start monitoring if enabled
+            # Start monitoring if enabled (the hub monitors the shared managers)
             if self.enable_monitoring:
-                if hasattr(self.thread_manager, "start_monitoring"):
-                    self.thread_manager.start_monitoring(interval=self.monitor_interval)
-                if hasattr(self.pool_manager, "start_monitoring"):
-                    self.pool_manager.start_monitoring(interval=self.monitor_interval)
-                if hasattr(self.process_manager, "start_monitoring"):
-                    self.process_manager.start_monitoring(interval=self.monitor_interval)
+                for kind in ("thread", "pool", "process"):
+                    manager = self._managers[kind]
+                    if self._owns_managers.get(kind, False) and hasattr(manager, "start_monitoring"):
+                        manager.start_monitoring(interval=self.monitor_interval)
                 
                 # Start async monitoring task (using thread instead of async to avoid warnings)
                 def monitor_loop_sync():
-                    import time
                     while True:
                         time.sleep(self.monitor_interval)
                         try:
-                            stats = self.get_statistics()
-                            logger.debug(f"Monitoring: {stats}")
+                            if _debug_enabled():
+                                logger.debug(f"Monitoring: {self.get_statistics()}")
                         except Exception as e:
                             logger.warning(f"Monitoring error: {e}")
                             break
                 
                 # Use thread instead of async to avoid coroutine warnings
-                import threading
                 monitor_thread = threading.Thread(
                     target=monitor_loop_sync,
                     name="HealthMonitor",
@@ -311,6 +529,17 @@ class IntegratedFileReader:
                         max_workers=self.max_workers
                     )
                     
+                    # Each block already fans out over the storage pipeline's
+                    # executor, so a couple of blocks in flight is enough
+                    self._storage_executor = ThreadPoolExecutor(
+                        max_workers=2,
+                        thread_name_prefix="storage"
+                    )
+                    self._extract_executor = ThreadPoolExecutor(
+                        max_workers=2,
+                        thread_name_prefix="extract"
+                    )
+                    
                     logger.info(f"Storage pipeline initialized (source: {self.storage_source}, side: {self.storage_side})")
                 except Exception as storage_error:
                     logger.warning(f"Failed to initialize storage pipeline: {storage_error}")
@@ -322,31 +551,16 @@ class IntegratedFileReader:
             
         except Exception as e:
             logger.error(f"Failed to initialize concurrency managers: {e}")
-            import traceback
             traceback.print_exc()
             # Cleanup on failure
             self.shutdown()
             raise RuntimeError(f"Failed to initialize concurrency managers: {e}") from e
         
 
-    def _calculate_file_priority(self, file_info: Dict) -> int:
-
-        extension = file_info.get('extension', '').lower()
-        size_bytes = file_info.get('size_bytes', 0)
-        
-        # Base priority by file type (processing speed)
-        if extension in {'.txt', '.json', '.xml', '.csv', '.yaml', '.yml'}:
-            priority = 1  # Fast text processing
-        elif extension in {'.docx', '.xlsx', '.pptx', '.doc', '.xls', '.ppt'}:
-            priority = 3  # Moderate office processing
-        elif extension in {'.pdf'}:
-            priority = 5  # PDF with possible OCR
-        elif extension in {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'}:
-            priority = 7  # Image OCR (slow)
-        elif extension in {'.zip', '.rar', '.7z', '.tar', '.gz', '.eml', '.msg', '.pst'}:
-            priority = 9  # Archive extraction (creates more work)
-        else:
-            priority = 5  # Default medium priority
+    @staticmethod
+    def _priority_for(extension: str, size_bytes: int) -> int:
+        """Priority from an already-normalized extension and size"""
+        priority = _EXTENSION_PRIORITY.get(extension, _DEFAULT_PRIORITY)
         
         # Adjust for file size
         if size_bytes > 10 * 1024 * 1024:  # > 10MB
@@ -356,6 +570,28 @@ class IntegratedFileReader:
         
         # Cap at 10
         return min(priority, 10)
+
+    def _calculate_file_priority(self, file_info: Dict) -> int:
+        extension = (file_info.get('extension') or '').lower()
+        size_bytes = file_info.get('size_bytes') or 0
+        return self._priority_for(extension, size_bytes)
+    
+    def _classify_file(self, file_info: Dict):
+        """
+        Classify a file for scheduling in a single pass
+        
+        Returns:
+            (extension, priority, route) where route is "batch", "pool" or "thread"
+        """
+        extension = (file_info.get('extension') or '').lower()
+        size_bytes = file_info.get('size_bytes') or 0
+        priority = self._priority_for(extension, size_bytes)
+        
+        if extension in _BATCH_EXTENSIONS and size_bytes < _BATCH_MAX_BYTES:
+            return extension, priority, "batch"
+        if self._should_use_pool(file_info):
+            return extension, priority, "pool"
+        return extension, priority, "thread"
     
     # In integrated_reader.py - Change _should_use_pool method
 
@@ -409,15 +645,15 @@ class IntegratedFileReader:
         
         # Determine which manager to use
         use_pool = self._should_use_pool(file_info)
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             if use_pool:
                 # Use multiprocessing pool for CPU-intensive tasks
                 task_id = self.pool_manager.submit_task(
                     self.pool_pool_id,
-                    self._process_file_worker,
-                    (file_info, 0),
+                    _pool_worker,
+                    (file_info['path'], 0),
                     {}
                 )
                 
@@ -437,14 +673,14 @@ class IntegratedFileReader:
             else:
                 # Use thread pool for I/O-bound tasks
                 future = self._submit_thread_task(
-                    self._process_file_worker,
+                    self._select_worker(),
                     file_info,
                     0,
                     priority=ThreadPriority.NORMAL
                 )
                 result = future.result(timeout=300)
             
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             
             logger.info(f"File processed in {processing_time:.2f}s: {file_path}")
             record_command_line_action(
@@ -490,11 +726,10 @@ class IntegratedFileReader:
 
     def _should_batch(self, file_info: Dict) -> bool:
         """Check if file should be batched"""
-        extension = file_info.get('extension', '').lower()
-        size_bytes = file_info.get('size_bytes', 0)
+        extension = (file_info.get('extension') or '').lower()
+        size_bytes = file_info.get('size_bytes') or 0
         # Batch small text files
-        return (extension in {'.txt', '.json', '.xml', '.csv'} and 
-                size_bytes < 100 * 1024)  # < 100KB
+        return extension in _BATCH_EXTENSIONS and size_bytes < _BATCH_MAX_BYTES
 
     def _process_batch(self, file_infos: List[Dict], depth: int = 0) -> List[Dict]:
         """Process multiple small files in one worker"""
@@ -503,7 +738,8 @@ class IntegratedFileReader:
             result = main_specify_method_of_reading_the_file(
                 file_info,
                 collect=True,
-                depth=depth
+                depth=depth,
+                max_workers=self.max_workers
             )
             results.append(result)
 
@@ -547,28 +783,30 @@ class IntegratedFileReader:
             
         logger.info(f"Found {len(files)} files")
         
-        # Log file type distribution
+        # Classify every file once: type distribution, priority and route
         file_types = {}
+        priority_counts = {}
+        batch_files = []
+        thread_files = []
+        pool_files = []
+        routes = {"batch": batch_files, "thread": thread_files, "pool": pool_files}
+        debug = _debug_enabled()
         for file_info in files:
-            ext = file_info.get('extension', 'no_extension').lower()
+            ext, priority, route = self._classify_file(file_info)
+            ext = ext or 'no_extension'
             file_types[ext] = file_types.get(ext, 0) + 1
+            priority_counts[priority] = priority_counts.get(priority, 0) + 1
+            routes[route].append((file_info, priority))
+            if debug:
+                logger.debug(f"File: {file_info.get('name')} - Priority: {priority} - Size: {file_info.get('size')}")
         
         logger.info(f"File type distribution: {dict(sorted(file_types.items(), key=lambda x: x[1], reverse=True)[:10])}")
         
-        # Calculate priorities for all files
-        file_priorities = []
-        for file_info in files:
-            priority = self._calculate_file_priority(file_info)
-            file_priorities.append((file_info, priority))
-            logger.debug(f"File: {file_info.get('name')} - Priority: {priority} - Size: {file_info.get('size')}")
-        
-        # Sort by priority for display
-        file_priorities.sort(key=lambda x: x[1])
+        # Sort by priority so lower-priority work is submitted first
+        for route_files in routes.values():
+            route_files.sort(key=lambda x: x[1])
         
         logger.info(f"Priority distribution:")
-        priority_counts = {}
-        for _, priority in file_priorities:
-            priority_counts[priority] = priority_counts.get(priority, 0) + 1
         for priority in sorted(priority_counts.keys()):
             logger.info(f"  Priority {priority}: {priority_counts[priority]} files")
         
@@ -590,30 +828,26 @@ class IntegratedFileReader:
                 "completed": 0,
                 "failed": 0,
                 "in_progress": 0,
-                "start_time": time.time(),
+                "start_time": time.monotonic(),
                 "end_time": None,
                 "original_files": len(files),  # Track original file count separately
                 "extracted_files": 0  # Track extracted files count
             }
+            self._publish_stats()
         
         self.results = []
-        self.recent_failures = []
+        self._results_snapshot = ()
+        self._results_queue = SimpleQueue()
+        self._original_count = 0
+        self._original_names = set()
+        self._reset_circuit_breaker()
         self.is_processing = True
         
         # Separate files by type and create tasks
         future_to_file = {}
         task_id_to_file = {}  # For pool tasks
+        done_queue = SimpleQueue()  # Thread futures put themselves here when they finish
         
-        # Separate batchable and individual files
-        batch_files = []
-        individual_files = []
-
-        for file_info, priority in file_priorities:
-            if self._should_batch(file_info):
-                batch_files.append((file_info, priority))
-            else:
-                individual_files.append((file_info, priority))
-
         # Create batches of 10 files each
         batch_size = 10
         batches = []
@@ -623,7 +857,7 @@ class IntegratedFileReader:
             batches.append((batch, avg_priority))
 
         logger.info(f"Created {len(batches)} batches for {len(batch_files)} small files")
-        logger.info(f"Individual files to process: {len(individual_files)}")
+        logger.info(f"Individual files to process: {len(thread_files) + len(pool_files)}")
 
         # Submit batches to thread pool (I/O-bound) using ThreadManager
         for batch, priority in batches:
@@ -633,20 +867,21 @@ class IntegratedFileReader:
                 0,
                 priority=ThreadPriority.NORMAL
             )
-            future_to_file[future] = ({"name": f"Batch of {len(batch)} files"}, priority)
+            future.context = future_to_file[future] = ({"name": f"Batch of {len(batch)} files"}, priority)
+            future.add_done_callback(done_queue.put)
 
         # Submit individual files based on type - CRITICAL: Process ALL files
         submitted_count = 0
-        for file_info, priority in individual_files:
-            use_pool = self._should_use_pool(file_info)
-            
+        individual_files = [(f, p, True) for f, p in pool_files] + [(f, p, False) for f, p in thread_files]
+        worker_fn = self._select_worker()
+        for file_info, priority, use_pool in individual_files:
             try:
                 if use_pool:
                     # Use multiprocessing pool for CPU-intensive tasks
                     task_id = self.pool_manager.submit_task(
                         self.pool_pool_id,
-                        self._process_file_worker,
-                        (file_info, 0),
+                        _pool_worker,
+                        (file_info['path'], 0),
                         {}
                     )
                     if task_id:
@@ -657,25 +892,23 @@ class IntegratedFileReader:
                 else:
                     # Use thread manager for I/O-bound tasks
                     future = self._submit_thread_task(
-                        self._process_file_worker,
+                        worker_fn,
                         file_info,
                         0,
                         priority=ThreadPriority.NORMAL
                     )
-                    future_to_file[future] = (file_info, priority)
+                    future.context = future_to_file[future] = (file_info, priority)
+                    future.add_done_callback(done_queue.put)
                     submitted_count += 1
             except Exception as e:
                 logger.error(f"❌ Error submitting task for {file_info.get('name', 'unknown')}: {e}")
                 # Create a failed result for this file to ensure it's tracked
-                failed_result = {
-                    "Metadata": file_info,
-                    "Content": {"error": f"Failed to submit task: {str(e)}"}
-                }
-                with self.results_lock:
-                    self.results.append(failed_result)
+                failed_result = _error_result(file_info, f"Failed to submit task: {str(e)}")
+                self._add_original_results([failed_result])
                 with self.stats_lock:
                     self.stats['failed'] += 1
                     self.stats['total'] += 1
+                    self._publish_stats()
         
         logger.info(f"Submitted {submitted_count} individual files + {len(batches)} batches = {submitted_count + len(batches)} tasks")
         
@@ -709,29 +942,23 @@ class IntegratedFileReader:
                 missing_files_added = 0
                 for file_info in files:
                     if file_info.get('name') in missing_file_names:
-                        failed_result = {
-                            "Metadata": file_info,
-                            "Content": {"error": "File was not submitted for processing - possible batching or submission error"}
-                        }
-                        with self.results_lock:
-                            self.results.append(failed_result)
+                        failed_result = _error_result(file_info, "File was not submitted for processing - possible batching or submission error")
+                        self._add_original_results([failed_result])
                         with self.stats_lock:
                             self.stats['failed'] += 1
                             self.stats['total'] += 1
+                            self._publish_stats()
                         missing_files_added += 1
                 logger.warning(f"   Added {missing_files_added} failed results for missing files to ensure tracking")
                 # Create failed results for missing files
                 for file_info in files:
                     if file_info.get('name') in missing_file_names:
-                        failed_result = {
-                            "Metadata": file_info,
-                            "Content": {"error": "File was not submitted for processing"}
-                        }
-                        with self.results_lock:
-                            self.results.append(failed_result)
+                        failed_result = _error_result(file_info, "File was not submitted for processing")
+                        self._add_original_results([failed_result])
                         with self.stats_lock:
                             self.stats['failed'] += 1
                             self.stats['total'] += 1
+                            self._publish_stats()
 
         
         # Process as they complete with circuit breaker
@@ -740,7 +967,30 @@ class IntegratedFileReader:
         completed = 0
         # Use total_submitted for progress bar to account for batches
         # But we'll track actual file count separately
-        pbar = tqdm(total=len(files), desc="Processing files", unit="file")
+        # Progress updates are accumulated and flushed every ~0.5% of the files
+        # (or every 100ms) so tqdm's lock and redraw aren't hit per completion
+        pbar_step = max(1, len(files) // 200)
+        pbar = tqdm(total=len(files), desc="Processing files", unit="file",
+                    mininterval=0.2, miniters=pbar_step)
+        pending_updates = 0
+        last_pbar_flush = time.monotonic()
+        latest_postfix = None
+
+        def _advance_pbar(n: int = 1, priority=None, file_name: str = None):
+            # The postfix only shows the latest file, so it is written with the flush
+            nonlocal pending_updates, last_pbar_flush, latest_postfix
+            pending_updates += n
+            if file_name is not None:
+                latest_postfix = (priority, file_name)
+            now = time.monotonic()
+            if pending_updates >= pbar_step or now - last_pbar_flush >= 0.1:
+                if latest_postfix:
+                    pbar.set_postfix({"Priority": latest_postfix[0], "File": latest_postfix[1][:30]}, refresh=False)
+                    latest_postfix = None
+                pbar.update(pending_updates)
+                pending_updates = 0
+                last_pbar_flush = now
+
         circuit_breaker_triggered = False
         files_processed_count = 0  # Track actual number of files processed (not tasks)
         
@@ -759,547 +1009,137 @@ class IntegratedFileReader:
             
             logger.info(f"Processing {len(all_futures)} thread futures...")
             
-            # Process ALL futures - use while loop to ensure we get every single one
-            max_wait_iterations = 1000000  # Very high limit
-            iteration = 0
+            # Every completion retires exactly one task, so count down instead of rescanning
+            self._outstanding = len(all_futures) + len(task_id_to_file)
+            # Results are stored in bulk blocks
+            pending_storage = []
             
-            while len(processed_futures) < len(all_futures) and iteration < max_wait_iterations:
-                iteration += 1
-                
-                # Check which futures are done
-                done_futures = [f for f in all_futures if f.done() and f not in processed_futures]
-                
-                if done_futures:
-                    # Process all done futures
-                    for future in done_futures:
-                        processed_futures.add(future)
-                else:
-                    remaining = [f for f in all_futures if f not in processed_futures]
-                    if remaining:
-                        # Wait for at least one to complete
-                        done_any = self._as_completed_thread_tasks(remaining, timeout=0.5)
-                        for future in done_any:
-                            processed_futures.add(future)
-                            break  # Process one, then check again
-            
-            if len(processed_futures) < len(all_futures):
-                logger.error(f"❌ Only processed {len(processed_futures)}/{len(all_futures)} futures after {iteration} iterations!")
-                # Force process remaining ones
-                for future in all_futures:
-                    if future not in processed_futures:
-                        if future.done():
-                            processed_futures.add(future)
-                        else:
-                            logger.error(f"   Future for {future_to_file[future][0].get('name', 'unknown')} still not done!")
+            # Bound once; the handler runs for every thread future
+            stats, stats_lock = self.stats, self.stats_lock
+            check_circuit_breaker = self._check_circuit_breaker
+            finalize_result = self._finalize_result
             
-            # Now process all completed futures
-            for future in processed_futures:
+            def _handle_thread_future(future):
+                nonlocal completed, files_processed_count, circuit_breaker_triggered
                 # Check circuit breaker before processing result (but don't stop for storage errors)
-                if self._check_circuit_breaker():
+                if check_circuit_breaker():
                     logger.warning("⚠️ Circuit breaker triggered - too many failures, but continuing...")
                     # Don't break - continue processing remaining files
-                    # circuit_breaker_triggered = True
+                    circuit_breaker_triggered = True
                 
-                file_info, priority = future_to_file[future]
+                file_info, priority = future.context
                 file_name = file_info.get('name', 'unknown')
                 completed += 1
                 files_processed_count += 1  # Track actual files
                 
                 logger.info(f"Completed task [{completed}/{total_submitted}] | Files [{files_processed_count}/{len(files)}] | Priority {priority}: {file_name}")
                 
-                with self.stats_lock:
-                    self.stats['in_progress'] = sum(1 for f in future_to_file.keys() if not f.done()) + len(task_id_to_file)
+                with stats_lock:
+                    self._outstanding -= 1
+                    stats['in_progress'] = self._outstanding
+                    self._publish_stats()
                 
                 try:
-                    # Increased timeout to handle large files
-                    result = future.result(timeout=3600)  # 1 hour timeout for very large files
+                    # Only finished futures get here, so result() never blocks
+                    result = future.result()
                     
-                    # Handle batch results - each file in batch counts as separate file
                     if isinstance(result, list):
-                        with self.results_lock:
-                            self.results.extend(result)
-                        for r in result:
-                            is_failure = bool(r and r.get("Content", {}).get("error"))
-                            
-                            # Store to database if enabled (even if failed, to track all files)
-                            if self.enable_storage and r:
-                                try:
-                                    file_info = r.get("Metadata", {})
-                                    if file_info:
-                                        # Use synchronous storage to ensure it completes
-                                        path_id = self.storage_pipeline.store_file_complete(
-                                            file_info,
-                                            r,
-                                            use_async=False
-                                        )
-                                        if not path_id:
-                                            logger.debug(f"⚠ Batch file storage returned None (may be duplicate)")
-                                        else:
-                                            # Store extracted files from archives/emails individually
-                                            # Note: Even if main file failed, extracted files should still be stored
-                                            if path_id:
-                                                                                         # Store extracted files using shared utility
-                                                def _add_result(r):
-                                                    try:
-                                                        with self.results_lock:
-                                                            self.results.append(r)
-                                                    except Exception:
-                                                        pass
-
-                                                counts = recursively_store_extracted(
-                                                    self.storage_pipeline,
-                                                    result,
-                                                    parent_path_id=path_id,
-                                                    add_result_fn=_add_result,
-                                                    logger=logger
-                                                )
-
-                                                # Update counters
-                                                with self.stats_lock:
-                                                    processed_count = counts.get('processed', 0)
-                                                    self.stats['extracted_files'] += processed_count
-                                                    self.stats['total'] += processed_count
-
-                                                if counts.get('stored'):
-                                                    logger.info(f"✓ Stored {counts['stored']} extracted files (duplicates: {counts.get('duplicates', 0)}, errors: {counts.get('errors', 0)})")
-                                                    
-                                            elif not bool(r and r.get("Content", {}).get("error")):
-                                                # If main file succeeded but path_id is None (duplicate),
-                                                # still try to store extracted files with parent_path_id=None
-                                                logger.debug(f"Main file returned None (duplicate), storing extracted files without parent")
-                                                self._store_extracted_files(r, None)
-                                except Exception as storage_error:
-                                    logger.error(f"✗ Storage error in batch: {storage_error}", exc_info=True)
-                            
-                            with self.stats_lock:
-                                if not is_failure:
-                                    self.stats['completed'] += 1
-                                else:
-                                    self.stats['failed'] += 1
-                            if is_failure:
-                                failure_type = "processing_error" if result.get("Content", {}).get("error") else "storage_error"
-                                self.recent_failures.append(failure_type)
-                            else:
-                                self.recent_failures.append("success")
-                        
-                        # Update progress bar and counters for batch files
-                        batch_size = len(result)
-                        files_processed_count += batch_size - 1  # Additional files from batch
-                        pbar.update(batch_size - 1)  # Update progress bar for remaining files in batch
-                    else:
-                        with self.results_lock:
-                            self.results.append(result)
-                        
-                        # Check if this file failed
-                        is_failure = bool(result and result.get("Content", {}).get("error"))
-                        
-                        # Store to database if enabled (even if failed, to track all files)
-                        if self.enable_storage and result:
-                            try:
-                                file_info = result.get("Metadata", {})
-                                if file_info:
-                                    # Use synchronous storage to ensure it completes
-                                    path_id = self.storage_pipeline.store_file_complete(
-                                        file_info,
-                                        result,
-                                        use_async=False
-                                    )
-                                    if path_id:
-                                        logger.debug(f"✓ Stored {file_name} to database (path_id: {path_id})")
-                                    else:
-                                        logger.warning(f"⚠ Storage returned None for {file_name} (may be duplicate or error)")
-                                    
-                                    # Store extracted files from archives/emails individually
-                                    # Note: Even if main file failed, extracted files should still be stored
-                                    if path_id:
-                                         # Store extracted files using shared utility
-                                        def _add_result(r):
-                                            try:
-                                                with self.results_lock:
-                                                    self.results.append(r)
-                                            except Exception:
-                                                pass
-
-                                        counts = recursively_store_extracted(
-                                            self.storage_pipeline,
-                                            result,
-                                            parent_path_id=path_id,
-                                            add_result_fn=_add_result,
-                                            logger=logger
-                                        )
-
-                                        # Update counters
-                                        with self.stats_lock:
-                                            processed_count = counts.get('processed', 0)
-                                            self.stats['extracted_files'] += processed_count
-                                            self.stats['total'] += processed_count
-
-                                        if counts.get('stored'):
-                                            logger.info(f"✓ Stored {counts['stored']} extracted files (duplicates: {counts.get('duplicates', 0)}, errors: {counts.get('errors', 0)})")
-    
-                                    else:
-                                        logger.warning(f"⚠️ Storage returned None or failed for {file_name} (may be duplicate or error)")
-                                        
-                            except Exception as storage_error:
-                                logger.error(f"✗ Storage error for {file_name}: {storage_error}", exc_info=True)
-                                
-                        with self.stats_lock:
-                            if not is_failure:
-                                self.stats['completed'] += 1
-                            else:
-                                self.stats['failed'] += 1
-                        
-                        # Track for circuit breaker
-                            if is_failure:
-                                failure_type = "processing_error" if result.get("Content", {}).get("error") else "storage_error"
-                                self.recent_failures.append(failure_type)
-                            else:
-                                self.recent_failures.append("success")
-                    
-                    if len(self.recent_failures) > self.failure_window * 2:
-                        self.recent_failures = self.recent_failures[-self.failure_window * 2:]
-                        
-                except TimeoutError:
-                    logger.error(f"Timeout processing {file_name}")
-                    # Create error result for timeout
-                    error_result = {
-                        "Metadata": file_info,
-                        "Content": {"error": f"Timeout after 3600 seconds"}
-                    }
-                    with self.results_lock:
-                        self.results.append(error_result)
-                    
-                    # Store to database if enabled (even if failed, to track all files)
-                    if self.enable_storage:
-                        try:
-                            storage_response = self.storage_pipeline.store_file_complete(
-                                file_info,
-                                error_result,
-                                use_async=False
-                            )
-                            if storage_response and storage_response.is_success:
-                                logger.debug(f"⚠️ Stored timeout file {file_name} to database (path_id: {storage_response.path_id})")
-                        except Exception as storage_error:
-                            logger.error(f"✗ Storage error for timeout file {file_name}: {storage_error}", exc_info=True)
-                            
-                    with self.stats_lock:
-                        self.stats['failed'] += 1
-                    self.recent_failures.append(True)
-                    future.cancel()
+                        # Each file in a batch counts as a separate file
+                        files_processed_count += len(result) - 1
+                        _advance_pbar(len(result) - 1)
                     
                 except Exception as e:
                     logger.error(f"Error processing {file_name}: {e}")
-                    # Create error result for exception
-                    error_result = {
-                        "Metadata": file_info,
-                        "Content": {"error": str(e)}
-                    }
-                    with self.results_lock:
-                        self.results.append(error_result)
-                    
-                    # Store to database if enabled (even if failed, to track all files)
-                    if self.enable_storage:
-                        try:
-                            path_id = self.storage_pipeline.store_file_complete(
-                                file_info,
-                                error_result,
-                                use_async=False
-                            )
-                            if path_id:
-                                logger.debug(f"⚠ Stored error file {file_name} to database (path_id: {path_id})")
-                        except Exception as storage_error:
-                            logger.error(f"✗ Storage error for error file {file_name}: {storage_error}", exc_info=True)
-                    
-                    with self.stats_lock:
-                        self.stats['failed'] += 1
-                    self.recent_failures.append(True)
-                    
-                pbar.update(1)
-                pbar.set_postfix({"Priority": priority, "File": file_name[:30]})
+                    result = _error_result(file_info, str(e))
+                
+                finalize_result(result, pending_storage)
+                _advance_pbar(1, priority, file_name)
+            
+            # Process ALL futures - each one puts itself on done_queue when it
+            # finishes, so results are handled as soon as they are ready
+            max_wait_time = 3600  # 1 hour max wait without any completion
+            pending_futures = set(all_futures)
+            
+            while pending_futures:
+                try:
+                    future = done_queue.get(timeout=max_wait_time)
+                except Empty:
+                    break
+                pending_futures.discard(future)
+                processed_futures.add(future)
+                _handle_thread_future(future)
+            
+            self._store_results_bulk(pending_storage)
             
             # CRITICAL: Double-check and wait for ANY remaining thread futures
-            remaining_futures = [f for f in future_to_file.keys() if f not in processed_futures]
-            if remaining_futures:
-                logger.warning(f"⚠️ Found {len(remaining_futures)} remaining thread futures - waiting for them...")
+            if pending_futures:
+                logger.error(f"❌ Only processed {len(processed_futures)}/{len(all_futures)} futures after waiting {max_wait_time}s!")
+                logger.warning(f"⚠️ Found {len(pending_futures)} remaining thread futures - waiting for them...")
                 # Wait for all remaining futures with a longer timeout
-                start_wait = time.time()
-                max_wait_time = 3600  # 1 hour max wait
-                
-                while remaining_futures and (time.time() - start_wait) < max_wait_time:
-                    # Check which ones are done
-                    done_futures = [f for f in remaining_futures if f.done()]
-                    for future in done_futures:
-                        remaining_futures.remove(future)
-                        processed_futures.add(future)
-                    
-                    if not done_futures:
-                        # Wait a bit and check again using custom waiter
-                        time.sleep(0.1)
-                        done_any = self._as_completed_thread_tasks(remaining_futures, timeout=1)
-                        if done_any:
-                            for future in done_any:
-                                if future in remaining_futures:
-                                    remaining_futures.remove(future)
-                                processed_futures.add(future)
-                                break
+                done_futures, pending_futures = wait(
+                    pending_futures,
+                    timeout=max_wait_time,
+                    return_when=ALL_COMPLETED
+                )
+                for future in pending_futures:
+                    logger.error(f"   Future for {future.context[0].get('name', 'unknown')} still not done!")
+                for future in done_futures:
+                    processed_futures.add(future)
+                    _handle_thread_future(future)
                 
-                if remaining_futures:
-                    logger.error(f"❌ {len(remaining_futures)} futures still not completed after waiting!")
-                    # Force process them anyway
-                    for future in remaining_futures:
-                        try:
-                            if future.done():
-                                processed_futures.add(future)
-                                
-                                try:
-                                    file_info, priority = future_to_file[future]
-                                    file_name = file_info.get('name', 'unknown')
-                                    result = future.result(timeout=3600)
-                                    completed += 1
-                                    files_processed_count += 1
-                                    
-                                    with self.results_lock:
-                                        if isinstance(result, list):
-                                            self.results.extend(result)
-                                        else:
-                                            self.results.append(result)
-                                    
-                                    is_failure = bool(result and result.get("Content", {}).get("error"))
-                                    
-                                    # Store to database if enabled (even if failed, to track all files)
-                                    if self.enable_storage and result:
-                                        try:
-                                            file_info_meta = result.get("Metadata", {}) if not isinstance(result, list) else None
-                                            if file_info_meta:
-                                                path_id = self.storage_pipeline.store_file_complete(
-                                                    file_info_meta, result, use_async=False
-                                                )
-                                                if path_id:
-                                                    # Store extracted files using shared utility
-                                                        def _add_result(r):
-                                                            try:
-                                                                with self.results_lock:
-                                                                    self.results.append(r)
-                                                            except Exception:
-                                                                pass
-
-                                                        counts = recursively_store_extracted(
-                                                            self.storage_pipeline,
-                                                            result,
-                                                            parent_path_id=path_id,
-                                                            add_result_fn=_add_result,
-                                                            logger=logger
-                                                        )
-
-                                                        # Update counters
-                                                        with self.stats_lock:
-                                                            processed_count = counts.get('processed', 0)
-                                                            self.stats['extracted_files'] += processed_count
-                                                            self.stats['total'] += processed_count
-
-                                                        if counts.get('stored'):
-                                                            logger.info(f"✓ Stored {counts['stored']} extracted files (duplicates: {counts.get('duplicates', 0)}, errors: {counts.get('errors', 0)})")
-                                        except Exception as e:
-                                            logger.error(f"Storage error: {e}")
-                                    
-                                    with self.stats_lock:
-                                        if not is_failure:
-                                            self.stats['completed'] += 1
-                                        else:
-                                            self.stats['failed'] += 1
-                                    
-                                    pbar.update(1)
-                                    pbar.set_postfix({"Priority": priority, "File": file_name[:30]})
-                                except Exception as e:
-                                    logger.error(f"Error processing remaining future: {e}")
-                                    # Create error result
-                                    file_info, priority = future_to_file[future]
-                                    error_result = {
-                                        "Metadata": file_info,
-                                        "Content": {"error": f"Error processing remaining future: {str(e)}"}
-                                    }
-                                    with self.results_lock:
-                                        self.results.append(error_result)
-                                    
-                                    # Store to database if enabled
-                                    if self.enable_storage:
-                                        try:
-                                            path_id = self.storage_pipeline.store_file_complete(
-                                                file_info, error_result, use_async=False
-                                            )
-                                            if path_id:
-                                                logger.debug(f"⚠ Stored error remaining future file to database (path_id: {path_id})")
-                                        except Exception as storage_error:
-                                            logger.error(f"✗ Storage error for remaining future: {storage_error}")
-                                    
-                                    with self.stats_lock:
-                                        self.stats['failed'] += 1
-                                    pbar.update(1)
-                        except Exception as e:
-                            logger.error(f"Error accessing remaining future: {e}")
-                            # Create error result for future we can't access
-                            try:
-                                file_info, priority = future_to_file[future]
-                                error_result = {
-                                    "Metadata": file_info,
-                                    "Content": {"error": f"Could not access future result: {str(e)}"}
-                                }
-                                with self.results_lock:
-                                    self.results.append(error_result)
-                                
-                                # Store to database if enabled
-            # Store to database if enabled
-                                if self.enable_storage:
-                                    try:
-                                        storage_response = self.storage_pipeline.store_file_complete(
-                                            file_info, error_result, use_async=False
-                                                    )
-                                        if storage_response and storage_response.is_success:
-                                            logger.debug(f"⚠️ Stored inaccessible future file to database (path_id: {storage_response.path_id})")
-                                    except Exception as storage_error:
-                                        logger.error(f"✗ Storage error for inaccessible future: {storage_error}")
-                                
-                                with self.stats_lock:
-                                    self.stats['failed'] += 1
-                                pbar.update(1)
-                            except:
-                                pass
+                self._store_results_bulk(pending_storage)
             
             # Process pool tasks - process ALL tasks regardless of circuit breaker
             processed_pool_tasks = set()
-            all_pool_tasks = list(task_id_to_file.items())
-            logger.info(f"Processing {len(all_pool_tasks)} pool tasks...")
+            logger.info(f"Processing {len(task_id_to_file)} pool tasks...")
             
-            # Process ALL pool tasks - no skipping
-            for task_id, (file_info, priority, _) in all_pool_tasks:
-                if task_id in processed_pool_tasks:
-                    logger.warning(f"⚠️ Task {task_id} already processed, skipping...")
-                    continue
-                
-                logger.debug(f"Processing pool task {task_id}: {file_info.get('name', 'unknown')}")
+            def _pool_outcomes():
+                # Tasks come out in the order they finish, so a slow file doesn't
+                # hold back the ones behind it
+                # Increased timeout for large files (images, PDFs, archives)
+                yield from self.pool_manager.iter_completed(
+                    self.pool_pool_id,
+                    list(task_id_to_file),
+                    timeout=3600  # 1 hour without any task finishing
+                )
+                # Whatever is left timed out (or was never found)
+                for task_id in list(unhandled_pool_tasks):
+                    yield task_id, None
+            
+            # Process ALL pool tasks - no skipping; each task is consumed exactly once
+            unhandled_pool_tasks = dict(task_id_to_file)
+            for task_id, result_obj in _pool_outcomes():
+                file_info, priority, _ = unhandled_pool_tasks.pop(task_id)
+                processed_pool_tasks.add(task_id)
+                file_name = file_info.get('name', 'unknown')
+                if _debug_enabled():
+                    logger.debug(f"Processing pool task {task_id}: {file_name}")
                     
                 try:
-                    # Increased timeout for large files (images, PDFs, archives)
-                    result_obj = self.pool_manager.wait_for_task(
-                        self.pool_pool_id,
-                        task_id,
-                        timeout=3600  # 1 hour for very large files
-                    )
-                    
-                    file_name = file_info.get('name', 'unknown')
-                    
                     if result_obj and result_obj.success:
                         result = result_obj.result
-                        processed_pool_tasks.add(task_id)
-                        completed += 1
-                        files_processed_count += 1
                     elif result_obj is None:
                         # Timeout or task not found
                         logger.warning(f"Pool task {task_id} returned None (timeout or not found) for {file_name}")
-                        result = {
-                            "Metadata": file_info,
-                            "Content": {"error": "Pool task timeout or not found"}
-                        }
-                        processed_pool_tasks.add(task_id)  # Mark as processed to avoid infinite loop
-                        completed += 1
-                        files_processed_count += 1
+                        result = _error_result(file_info, "Pool task timeout or not found")
                     else:
                         # Create error result for failed pool task
                         error_msg = result_obj.error if result_obj else "Pool task failed or timed out"
                         logger.warning(f"Pool task failed for {file_name}: {error_msg}")
-                        result = {
-                            "Metadata": file_info,
-                            "Content": {"error": error_msg}
-                        }
-                        processed_pool_tasks.add(task_id)
-                        completed += 1
-                        files_processed_count += 1
-                    
-                    # Always add result to results list (even if failed)
-                    with self.results_lock:
-                        self.results.append(result)
-                    
-                    is_failure = bool(result and result.get("Content", {}).get("error"))
-                    
-                    # Store to database if enabled (even if failed, to track all files)
-# Store to database if enabled (even if failed, to track all files)
-                    if self.enable_storage and result:
-                        try:
-                            file_info_meta = result.get("Metadata", {}) if not isinstance(result, list) else None
-                            if file_info_meta:
-                                storage_response = self.storage_pipeline.store_file_complete(
-                                    file_info_meta, result, use_async=False
-                                )
-                                if storage_response and storage_response.is_success:
-                                    # Store extracted files using shared utility
-                                    def _add_result(r):
-                                        try:
-                                            with self.results_lock:
-                                                self.results.append(r)
-                                        except Exception:
-                                            pass
-                                        
-                                    counts = recursively_store_extracted(
-                                        self.storage_pipeline,
-                                        result,
-                                        parent_path_id=storage_response.path_id,
-                                        add_result_fn=_add_result,
-                                        logger=logger
-                                    )
-
-                                    # Update counters
-                                    with self.stats_lock:
-                                        processed_count = counts.get('processed', 0)
-                                        self.stats['extracted_files'] += processed_count
-                                        self.stats['total'] += processed_count
-
-                                    if counts.get('stored'):
-                                        logger.info(f"✓ Stored {counts['stored']} extracted files (duplicates: {counts.get('duplicates', 0)}, errors: {counts.get('errors', 0)})")
-                        except Exception as e:
-                            logger.error(f"Storage error: {e}")
-                    
-                    with self.stats_lock:
-                        if not is_failure:
-                            self.stats['completed'] += 1
-                        else:
-                            self.stats['failed'] += 1
-                    
-                    if is_failure:
-                        failure_type = "processing_error" if result.get("Content", {}).get("error") else "storage_error"
-                        self.recent_failures.append(failure_type)
-                    else:
-                        self.recent_failures.append("success")
-                        
-                    pbar.update(1)
-                    pbar.set_postfix({"Priority": priority, "File": file_name[:30]})
+                        result = _error_result(file_info, error_msg)
+                    completed += 1
+                    files_processed_count += 1
                         
                 except Exception as e:
                     logger.error(f"Error processing pool task {task_id}: {e}")
                     # Create error result for exception
-                    error_result = {
-                        "Metadata": file_info,
-                        "Content": {"error": f"Pool task exception: {str(e)}"}
-                    }
-                    with self.results_lock:
-                        self.results.append(error_result)
-                    
-                    # Store to database if enabled (even if failed, to track all files)
-                    if self.enable_storage:
-                        try:
-                            storage_response = self.storage_pipeline.store_file_complete(
-                                file_info,
-                                error_result,
-                                use_async=False
-                            )
-                            if storage_response and storage_response.is_success:
-                                logger.debug(f"⚠️ Stored error pool task file {file_info.get('name', 'unknown')} to database (path_id: {storage_response.path_id})")
-                        except Exception as storage_error:
-                            logger.error(f"✗ Storage error for error pool task file: {storage_error}", exc_info=True)
-                    
-                    with self.stats_lock:
-                        self.stats['failed'] += 1
-                    self.recent_failures.append(True)
-                    pbar.update(1)
+                    result = _error_result(file_info, f"Pool task exception: {str(e)}")
+                
+                # Always record the result (even if failed)
+                self._finalize_result(result, pending_storage)
+                _advance_pbar(1, priority, file_info.get('name', 'unknown'))
+            
+            self._store_results_bulk(pending_storage)
         
         except TimeoutError:
             logger.warning("⚠ Some tasks timed out, but continuing with remaining files...")
@@ -1309,11 +1149,15 @@ class IntegratedFileReader:
             #         future.cancel()
                     
         finally:
+            if pending_updates:
+                pbar.update(pending_updates)
             pbar.close()
-            
-            
-            
-  # Count all processed files (including those that returned results with errors)
+        
+        # Storage may still be adding extracted files to the results
+        self._wait_for_storage()
+        
+        # Count all processed files (including those that returned results with errors)
+        self._drain_results()
         total_processed = len(self.results)
         total_submitted_final = len(processed_futures) + len(processed_pool_tasks) if 'processed_futures' in locals() and 'processed_pool_tasks' in locals() else total_submitted
         
@@ -1325,10 +1169,10 @@ class IntegratedFileReader:
         total_tasks_completed = futures_completed + pool_tasks_completed
         
         # Get accurate counts from stats (not from path markers)
-        with self.stats_lock:
-            original_files_count = self.stats.get('original_files', 0)
-            extracted_files_count = self.stats.get('extracted_files', 0)
-            total_files_processed = original_files_count + extracted_files_count
+        snapshot = self._stats_snapshot
+        original_files_count = snapshot.original_files
+        extracted_files_count = snapshot.extracted_files
+        total_files_processed = original_files_count + extracted_files_count
         
         logger.info(f"Completed processing:")
         logger.info(f"  - Total results in list: {total_processed}")
@@ -1350,32 +1194,30 @@ class IntegratedFileReader:
             logger.error(f"   Pool tasks: {len(task_id_to_file) - pool_tasks_completed} not completed")
             
             # Try to identify which files were not processed
-            processed_file_names = {r.get("Metadata", {}).get("name") for r in final_original_results if r and r.get("Metadata")}
-            all_file_names = {f.get("name") for f in files}
-            missing_files = all_file_names - processed_file_names
+            files_by_name = {f.get("name"): f for f in files}
+            missing_files = files_by_name.keys() - self._original_names
             if missing_files:
                 logger.error(f"   Missing files (first 50): {list(missing_files)[:50]}")
                 logger.error(f"   Total missing files: {len(missing_files)}")
                 
                 # Log file types of missing files
-                missing_file_types = {}
-                for file_info in files:
-                    if file_info.get('name') in missing_files:
-                        ext = file_info.get('extension', 'no_ext').lower()
-                        missing_file_types[ext] = missing_file_types.get(ext, 0) + 1
-                logger.error(f"   Missing file types: {dict(sorted(missing_file_types.items(), key=lambda x: x[1], reverse=True)[:10])}")
+                missing_file_types = Counter(
+                    files_by_name[name].get('extension', 'no_ext').lower()
+                    for name in missing_files
+                )
+                logger.error(f"   Missing file types: {dict(missing_file_types.most_common(10))}")
         
         
         # FINAL CHECK: Ensure all files are in results (even if failed)
-        final_original_results = [r for r in self.results if r and isinstance(r, dict) and r.get("Metadata", {}).get("path", "").count("::") == 0]
-        final_original_count = len(final_original_results)
+        final_original_count = self._original_count
         
         if final_original_count < len(files):
             logger.warning(f"⚠️ Final check: {len(files) - final_original_count} files still missing from results")
             logger.warning(f"   This may indicate files that were submitted but never returned results")
         
         with self.stats_lock:
-            self.stats['end_time'] = time.time()
+            self.stats['end_time'] = time.monotonic()
+            self._publish_stats()
             
         self.is_processing = False
         
@@ -1388,10 +1230,10 @@ class IntegratedFileReader:
             "Folder processing completed",
             {
                 "folder_path": folder_path,
-                "total_files": self.stats['total'],
-                "completed": self.stats['completed'],
-                "failed": self.stats['failed'],
-                "processing_time": self.stats['end_time'] - self.stats['start_time'],
+                "total_files": self._stats_snapshot.total,
+                "completed": self._stats_snapshot.completed,
+                "failed": self._stats_snapshot.failed,
+                "processing_time": self._stats_snapshot.end_time - self._stats_snapshot.start_time,
                 "circuit_breaker_triggered": circuit_breaker_triggered
             }
         )
@@ -1400,57 +1242,298 @@ class IntegratedFileReader:
     
     
     
-    def _check_circuit_breaker(self) -> bool:
+    def _reset_circuit_breaker(self):
+        """Close the circuit breaker and forget recorded outcomes"""
+        self.recent_failures.clear()
+        self._recent_failure_count = 0
+        self._outcomes.reset()
+        self._breaker_state = "closed"
+        self._open_until = 0.0
+    
+    def _trip_circuit_breaker(self, now: float, successes: int, failures: int):
+        """Open the circuit breaker for breaker_cooldown seconds"""
+        self._breaker_state = "open"
+        self._open_until = now + self.breaker_cooldown
+        total = successes + failures
+        rate = failures / total if total else 1.0
+        logger.error(
+            f"Circuit breaker triggered: {failures}/{total} processing failures ({rate:.0%}) "
+            f"in the last {self.failure_window_seconds:.0f}s"
+        )
+    
+    def _remember_outcome(self, failure_type: str, count: int = 1):
+        """Append outcomes to recent_failures, keeping the processing-error tally in step"""
+        recent = self.recent_failures
+        for _ in range(count):
+            if len(recent) == recent.maxlen and recent[0] == "processing_error":
+                self._recent_failure_count -= 1
+            recent.append(failure_type)
+        if failure_type == "processing_error":
+            self._recent_failure_count += count
+    
+    def _record_outcome(self, failure_type: str, count: int = 1):
         """
-        Check if we should stop processing due to too many PROCESSING failures
-        (Ignores storage-related failures like duplicates)
+        Record completed files for the circuit breaker
+        
+        Args:
+            failure_type: "success", "processing_error" or "storage_error"
+                (only processing errors count as failures)
+            count: Number of files with this outcome
         """
-        if len(self.recent_failures) < self.failure_window:
-            return False
+        self._remember_outcome(failure_type, count)
+        now = time.monotonic()
+        failed = failure_type == "processing_error"
+        self._outcomes.record(failed, count, now)
+        
+        if self._breaker_state == "open" and now >= self._open_until:
+            self._breaker_state = "half_open"
+        
+        if not failed:
+            # A healthy probe closes a half-open breaker
+            if self._breaker_state == "half_open":
+                self._breaker_state = "closed"
+                self._outcomes.reset()
+            return
         
-        recent = self.recent_failures[-self.failure_window:]
+        successes, failures = self._outcomes.totals(now)
+        if self._breaker_state == "half_open":
+            self._trip_circuit_breaker(now, successes, failures)
+        elif (self._breaker_state == "closed"
+              and successes + failures >= self.minimum_throughput
+              and failures >= self.failure_rate_threshold * (successes + failures)):
+            self._trip_circuit_breaker(now, successes, failures)
+    
+    def _add_results(self, results: List[Dict]):
+        """Queue several results for self.results as one queue entry (safe from any thread, no lock)"""
+        if results:
+            self._results_queue.put(list(results))
+    
+    def _add_original_results(self, results: List[Dict]):
+        """
+        Queue results of the submitted (non-extracted) files and tally them
+        (coordinator thread only; extracted files go through _add_results)
+        """
+        original_names = self._original_names
+        for r in results:
+            if r and isinstance(r, dict):
+                self._original_count += 1
+                metadata = r.get("Metadata")
+                if metadata:
+                    original_names.add(metadata.get("name"))
+        self._add_results(results)
+    
+    def _drain_results(self) -> List[Dict]:
+        """Move queued results into self.results and return it"""
+        drained = []
+        get_nowait = self._results_queue.get_nowait
+        while True:
+            try:
+                item = get_nowait()
+            except Empty:
+                break
+            # Blocks from _add_results arrive as lists (a single result is never a list)
+            if type(item) is list:
+                drained.extend(item)
+            else:
+                drained.append(item)
+        if drained:
+            with self.results_lock:
+                self.results.extend(drained)
+        return self.results
+    
+    def _finalize_result(self, result, pending_storage: List) -> int:
+        """
+        Record a finished task: add its result(s), queue them for bulk storage,
+        update the completed/failed counters and the circuit breaker
         
-        # Count only TRUE processing failures (not storage duplicates)
-        processing_failure_count = sum(
-            1 for failure_type in recent 
-            if failure_type == "processing_error"
+        Args:
+            result: Result dict of one file, or a list of them for a batch
+            pending_storage: Block of (file_info, result) pairs awaiting bulk storage
+            
+        Returns:
+            Number of failed files
+        """
+        results = result if isinstance(result, list) else [result]
+        self._add_original_results(results)
+        
+        failures = 0
+        enable_storage = self.enable_storage
+        queue_for_storage = pending_storage.append
+        for r in results:
+            if _is_failure(r):
+                failures += 1
+            # Store even failed files so every file is tracked
+            if enable_storage and r and r.get("Metadata"):
+                queue_for_storage((r["Metadata"], r))
+        
+        stats = self.stats
+        with self.stats_lock:
+            stats['completed'] += len(results) - failures
+            stats['failed'] += failures
+            self._publish_stats()
+        
+        successes = len(results) - failures
+        if successes:
+            self._record_outcome("success", successes)
+        if failures:
+            self._record_outcome("processing_error", failures)
+        
+        if len(pending_storage) >= _STORAGE_BULK_SIZE:
+            self._store_results_bulk(pending_storage)
+        return failures
+    
+    def _store_extracted_files(self, result: Dict, parent_path_id: Optional[int],
+                               extracted_results: List[Dict]) -> Optional[Dict[str, int]]:
+        """
+        Store the extracted files/attachments of a stored result
+        
+        The nested 'extracted_files' lists are removed from result as they are
+        stored (each extracted file is added to extracted_results on its own).
+        
+        Args:
+            result: Processing result of the parent file
+            parent_path_id: path_id of the stored parent (None if unknown)
+            extracted_results: Collects the extracted results; the caller adds
+                them to self.results and the counters in one go
+            
+        Returns:
+            Counts from recursively_store_extracted (None for leaf files)
+        """
+        content = result.get("Content") if isinstance(result, dict) else None
+        if not isinstance(content, dict) or ("extracted_files" not in content and "attachments" not in content):
+            return None
+        
+        counts = recursively_store_extracted(
+            self.storage_pipeline,
+            result,
+            parent_path_id=parent_path_id,
+            add_result_fn=extracted_results.append,
+            logger=logger
         )
         
-        if processing_failure_count >= self.failure_threshold:
-            logger.error(
-                f"Circuit breaker triggered: {processing_failure_count}/{self.failure_window} recent processing failures"
-            )
-            return True
+        if counts.get('stored'):
+            logger.info(f"✓ Stored {counts['stored']} extracted files (duplicates: {counts.get('duplicates', 0)}, errors: {counts.get('errors', 0)})")
+        return counts
+    
+    def _store_results_bulk(self, pending: List):
+        """
+        Hand a block of (file_info, result) pairs to the storage executor
+        (or store it inline if there is none). The pending list is cleared.
+        """
+        if not pending:
+            return
         
-        return False
+        block = list(pending)
+        pending.clear()
+        if self._storage_executor is None:
+            self._store_block(block)
+            return
+        self._storage_futures.append(self._storage_executor.submit(self._store_block, block))
+    
+    def _wait_for_storage(self):
+        """Block until every storage block handed to the executors is stored"""
+        storage_futures, self._storage_futures = self._storage_futures, []
+        if storage_futures:
+            logger.info(f"Waiting for {len(storage_futures)} storage blocks to finish...")
+            wait(storage_futures)
+        # Storage blocks are done, so no more extracted blocks can be queued
+        extract_futures, self._extract_futures = self._extract_futures, []
+        if extract_futures:
+            wait(extract_futures)
+        if self.storage_pipeline is not None:
+            self.storage_pipeline.wait_for_pending()
+    
+    def _store_block(self, block: List):
+        """
+        Store a block of (file_info, result) pairs with one bulk storage call,
+        then hand the parents that were stored to the extract stage.
+        """
+        try:
+            # Only path_ids are needed here; content/title/status finish in the background
+            responses = self.storage_pipeline.store_files_bulk(block, use_async=True)
+        except Exception as storage_error:
+            logger.error(f"✗ Bulk storage error for {len(block)} files: {storage_error}", exc_info=_debug_enabled())
+            return
+        
+        stored = []
+        debug = _debug_enabled()
+        for (file_info, result), response in zip(block, responses):
+            file_name = file_info.get('name', 'unknown')
+            if response and response.is_success:
+                if debug:
+                    logger.debug(f"✓ Stored {file_name} to database (path_id: {response.path_id})")
+                stored.append((file_name, result, response.path_id))
+            else:
+                logger.warning(f"⚠ Storage returned no path for {file_name} (may be duplicate or error)")
+        
+        if not stored:
+            return
+        if self._extract_executor is None:
+            self._store_extracted_block(stored)
+        else:
+            self._extract_futures.append(self._extract_executor.submit(self._store_extracted_block, stored))
+    
+    def _store_extracted_block(self, stored: List):
+        """Store the extracted files of (file_name, result, path_id) parents from one storage block"""
+        # Extracted files of the whole block are added with one queue put and one lock
+        extracted_results = []
+        extracted_count = 0
+        for file_name, result, path_id in stored:
+            try:
+                counts = self._store_extracted_files(result, path_id, extracted_results)
+                if counts:
+                    extracted_count += counts.get('processed', 0)
+            except Exception as storage_error:
+                logger.error(f"✗ Storage error for extracted files of {file_name}: {storage_error}", exc_info=_debug_enabled())
+        
+        self._add_results(extracted_results)
+        if extracted_count:
+            with self.stats_lock:
+                self.stats['extracted_files'] += extracted_count
+                self.stats['total'] += extracted_count
+                self._publish_stats()
+    
+    def _publish_stats(self):
+        """Swap in a fresh StatsSnapshot (call with stats_lock held)"""
+        self._stats_snapshot = StatsSnapshot(**self.stats)
+    
+    def _check_circuit_breaker(self) -> bool:
+        """
+        Check if the circuit breaker is open because the PROCESSING failure rate
+        within failure_window_seconds reached failure_rate_threshold (storage-related
+        failures like duplicates are ignored)
+        """
+        if self._breaker_state == "open" and time.monotonic() >= self._open_until:
+            self._breaker_state = "half_open"
+        return self._breaker_state == "open"
     
     def _display_summary(self, circuit_breaker_triggered=False):
         """Display processing summary"""
-        with self.stats_lock:
-            total = self.stats.get('total', 0)
-            original_files = self.stats.get('original_files', total)
-            extracted_files = self.stats.get('extracted_files', 0)
-            completed = self.stats['completed']
-            failed = self.stats['failed']
-            processing_time = (self.stats['end_time'] or time.time()) - (self.stats['start_time'] or time.time())
+        snapshot = self._stats_snapshot
+        total = snapshot.total
+        original_files = snapshot.original_files
+        extracted_files = snapshot.extracted_files
+        completed = snapshot.completed
+        failed = snapshot.failed
+        # Only called once process_folder has set both (monotonic) timestamps
+        processing_time = snapshot.end_time - snapshot.start_time
             
         success_rate = (completed / original_files * 100) if original_files > 0 else 0
         
-        logger.info(f"{'='*70}")
-        logger.info(f"FOLDER PROCESSING SUMMARY")
-        logger.info(f"{'='*70}")
-        logger.info(f"Original Files:          {original_files}")
-        logger.info(f"Extracted Files:         {extracted_files}")
-        logger.info(f"Total Files Processed:   {total}")
-        logger.info(f"Successful:              {completed}")
-        logger.info(f"Failed:                  {failed}")
-        logger.info(f"Success Rate:            {success_rate:.1f}%")
-        logger.info(f"Total Time:              {processing_time:.2f}s")
-        logger.info(f"Avg Time per File:       {processing_time/original_files:.2f}s" if original_files > 0 else "N/A")
-        logger.info(f"Files per Second:        {original_files/processing_time:.2f}" if processing_time > 0 else "N/A")
-        if circuit_breaker_triggered:
-            logger.warning(f"⚠️  Circuit Breaker:      TRIGGERED")
-        logger.info(f"{'='*70}\n")
+        # One record for the whole block instead of a handler write per line
+        summary = _SUMMARY_TEMPLATE % (
+            original_files,
+            extracted_files,
+            total,
+            completed,
+            failed,
+            success_rate,
+            processing_time,
+            "Avg Time per File:       %.2fs" % (processing_time / original_files) if original_files > 0 else "N/A",
+            "Files per Second:        %.2f" % (original_files / processing_time) if processing_time > 0 else "N/A",
+            "\n⚠️  Circuit Breaker:      TRIGGERED" if circuit_breaker_triggered else "",
+        )
+        (logger.warning if circuit_breaker_triggered else logger.info)(summary)
         
         if self.results:
             calculate_processing_statistics(self.results)
@@ -1460,6 +1543,27 @@ class IntegratedFileReader:
     # Replace the storage section in _store_extracted_files() method
 
      
+    def _select_worker(self) -> Callable[[Dict, int], Dict]:
+        """Worker for the current logging level (checked once per submission round)"""
+        return self._process_file_worker if _debug_enabled() else self._worker_fast
+    
+    def _worker_fast(self, file_info: Dict, depth: int = 0) -> Dict:
+        """_process_file_worker without the per-file debug logging"""
+        try:
+            result = main_specify_method_of_reading_the_file(
+                file_info,
+                collect=True,
+                depth=depth,
+                max_workers=self.max_workers
+            )
+        except Exception as e:
+            logger.error(f"Worker error processing {file_info.get('path')}: {e}")
+            return _error_result(file_info, str(e))
+        if result is None:
+            logger.warning(f"Worker returned None for {file_info.get('name', 'unknown')}, creating error result")
+            return _error_result(file_info, "File processing returned None")
+        return result
+    
     def _process_file_worker(self, file_info: Dict, depth: int = 0) -> Optional[Dict]:
         """
         Worker function that processes a single file
@@ -1472,33 +1576,31 @@ class IntegratedFileReader:
         Returns:
             Processing result (always returns a dict, never None)
         """
+        debug = _debug_enabled()
         try:
-            logger.debug(f"Worker processing: {file_info.get('name', 'unknown')}")
+            if debug:
+                logger.debug(f"Worker processing: {file_info.get('name', 'unknown')}")
             
             # Use your existing file processing function
             result = main_specify_method_of_reading_the_file(
                 file_info,
                 collect=True,
-                depth=depth
+                depth=depth,
+                max_workers=self.max_workers
             )
             
             # Ensure we always return a result dict, never None
             if result is None:
                 logger.warning(f"Worker returned None for {file_info.get('name', 'unknown')}, creating error result")
-                result = {
-                    "Metadata": file_info,
-                    "Content": {"error": "File processing returned None"}
-                }
+                result = _error_result(file_info, "File processing returned None")
             
-            logger.debug(f"Worker completed: {file_info.get('name', 'unknown')}")
+            if debug:
+                logger.debug(f"Worker completed: {file_info.get('name', 'unknown')}")
             return result
             
         except Exception as e:
-            logger.error(f"Worker error processing {file_info.get('path')}: {e}", exc_info=True)
-            return {
-                "Metadata": file_info,
-                "Content": {"error": str(e)}
-            }
+            logger.error(f"Worker error processing {file_info.get('path')}: {e}", exc_info=_debug_enabled())
+            return _error_result(file_info, str(e))
             
     def get_statistics(self) -> Dict:
         """
@@ -1507,22 +1609,31 @@ class IntegratedFileReader:
         Returns:
             Dictionary with statistics
         """
-        with self.stats_lock:
-            stats = self.stats.copy()
+        stats = self._stats_snapshot._asdict()
+        
+        recent = len(self.recent_failures)
+        stats['recent_failure_rate'] = self._recent_failure_count / recent if recent else 0.0
             
         # Add statistics from all managers
         if self.is_initialized:
-            stats['thread_manager'] = self.thread_manager.get_statistics()
-            stats['pool_manager'] = self.pool_manager.get_statistics()
-            stats['process_manager'] = self.process_manager.get_statistics()
-            stats['async_manager'] = self.async_manager.get_statistics()
+            for kind, manager in self._resolved_managers().items():
+                stats[f'{kind}_manager'] = manager.get_statistics()
                 
         return stats
         
-    def get_results(self) -> List[Dict]:
-        """Get all processing results"""
-        with self.results_lock:
-            return self.results.copy()
+    def get_results(self) -> Tuple[Dict, ...]:
+        """
+        Get all processing results as a read-only snapshot
+        
+        The snapshot is only rebuilt when new results arrived since the last
+        call; use list(...) on it if you need to modify it.
+        """
+        self._drain_results()
+        snapshot = self._results_snapshot
+        if len(snapshot) != len(self.results):
+            with self.results_lock:
+                snapshot = self._results_snapshot = tuple(self.results)
+        return snapshot
             
     def is_complete(self) -> bool:
         """Check if processing is complete"""
@@ -1530,11 +1641,17 @@ class IntegratedFileReader:
         
     # Control operations
     
+    def _own_thread_ids(self) -> List[str]:
+        """Thread ids to act on: all of an owned ThreadManager, else this reader's"""
+        if self._owns_managers.get("thread", False):
+            return list(self.thread_manager.threads.keys())
+        return list(self._thread_ids)
+    
     def pause_processing(self):
         """Pause all file processing across all managers"""
         if self.is_initialized:
-            # Pause all threads
-            for thread_id in list(self.thread_manager.threads.keys()):
+            # Pause this reader's threads
+            for thread_id in self._own_thread_ids():
                 self.thread_manager.pause_thread(thread_id)
             
             # Note: Pool and Process managers don't support pause, but we can stop accepting new tasks
@@ -1543,8 +1660,8 @@ class IntegratedFileReader:
     def resume_processing(self):
         """Resume file processing across all managers"""
         if self.is_initialized:
-            # Resume all threads
-            for thread_id in list(self.thread_manager.threads.keys()):
+            # Resume this reader's threads
+            for thread_id in self._own_thread_ids():
                 self.thread_manager.resume_thread(thread_id)
             
             logger.info("▶️  Processing resumed")
@@ -1552,11 +1669,20 @@ class IntegratedFileReader:
     def stop_processing(self):
         """Stop all file processing across all managers"""
         if self.is_initialized:
-            # Stop all managers
-            self.thread_manager.stop_all(timeout=10.0)
-            self.pool_manager.stop_all_pools()
-            self.process_manager.stop_all(timeout=10.0)
-            self.async_manager.stop_all()
+            # Stop the managers we created; on shared ones only our own threads and pool
+            if self._owns_managers.get("thread", False):
+                self.thread_manager.stop_all(timeout=10.0)
+            else:
+                for thread_id in self._own_thread_ids():
+                    self.thread_manager.stop_thread(thread_id, timeout=10.0)
+            if self._owns_managers.get("pool", False):
+                self.pool_manager.stop_all_pools()
+            elif self.pool_pool_id:
+                self.pool_manager.terminate_pool(self.pool_pool_id)
+            if self._owns_managers.get("process", False):
+                self.process_manager.stop_all(timeout=10.0)
+            if self._owns_managers.get("async", False):
+                self.async_manager.stop_all()
             
             self.is_processing = False
             logger.info("🛑 Processing stopped")
@@ -1565,10 +1691,8 @@ class IntegratedFileReader:
         """Get system health report from all managers"""
         health = {}
         if self.is_initialized and self.enable_monitoring:
-            health['thread_manager'] = self.thread_manager.get_statistics()
-            health['pool_manager'] = self.pool_manager.get_statistics()
-            health['process_manager'] = self.process_manager.get_statistics()
-            health['async_manager'] = self.async_manager.get_statistics()
+            for kind, manager in self._resolved_managers().items():
+                health[f'{kind}_manager'] = manager.get_statistics()
         return health
         
     # Context manager support
@@ -1590,6 +1714,14 @@ class IntegratedFileReader:
             # Flush storage batches if enabled
             if self.enable_storage:
                 try:
+                    if self._storage_executor:
+                        self._wait_for_storage()
+                        self._storage_executor.shutdown(wait=True)
+                        self._storage_executor = None
+                    if self._extract_executor:
+                        self._extract_executor.shutdown(wait=True)
+                        self._extract_executor = None
+                    
                     if self.batch_pipeline:
                         logger.info("Flushing storage batches...")
                         self.batch_pipeline.flush_all_batches()
@@ -1609,14 +1741,12 @@ class IntegratedFileReader:
                 except Exception as e:
                     logger.warning(f"Error during storage shutdown: {e}")
             
-            # Stop monitoring
+            # Stop monitoring (shared managers keep the hub's monitors)
             if self.enable_monitoring:
-                if hasattr(self.thread_manager, "stop_monitoring"):
-                    self.thread_manager.stop_monitoring()
-                if hasattr(self.pool_manager, "stop_monitoring"):
-                    self.pool_manager.stop_monitoring()
-                if hasattr(self.process_manager, "stop_monitoring"):
-                    self.process_manager.stop_monitoring()
+                for kind in ("thread", "pool", "process"):
+                    manager = self._managers[kind]
+                    if self._owns_managers.get(kind, False) and hasattr(manager, "stop_monitoring"):
+                        manager.stop_monitoring()
                 # Async manager monitoring is handled by thread, no need to stop separately
                 if hasattr(self, 'monitor_task_id') and self.monitor_task_id:
                     # Thread will stop automatically when daemon=True
@@ -1632,6 +1762,8 @@ class IntegratedFileReader:
             if self._owns_managers.get("async", False):
                 self.async_manager.shutdown()
             
+            # Write any buffered action-log entries before the process exits
+            flush_action_recording()
             logger.info("All managers shut down successfully")
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -3,10 +3,12 @@ Main file routing module that determines which reader to use based on file exten
 Simplified version with only JSON collection
 """
 
+import functools
 import os
 import threading
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 parent_dir = Path(__file__).parent.parent
@@ -24,7 +26,7 @@ logger = logging.getLogger(__name__)
 
 
 from core.file_utils import (
-    read_tree,
+    iter_tree,
     create_standardized_result
 
 )
@@ -41,41 +43,143 @@ from core.logging_utils import (
 
 )
 
+from core.extension_registry import get_registry_version
+
 
 MAX_RECURSION_DEPTH = 5
 
+# Extracted files are read on threads, but many are images and scanned PDFs
+# that run tesseract, so there is one slot per core. The slots are shared by
+# every nesting level and every caller: when none is free the file is read on
+# the calling thread, so nested archives cannot exhaust the workers.
+MAX_EXTRACTION_WORKERS = os.cpu_count() or 1
+_extraction_slots = threading.BoundedSemaphore(MAX_EXTRACTION_WORKERS)
+
+
+# Readers in lookup order: an extension listed by several readers (e.g. '.csv')
+# goes to the first one
+_READERS = (
+    ('office', "Reading office file", specify_office_method_of_reading_the_file, office_extensions),
+    ('remaining', "Reading file", specify_remaining_method_of_reading_the_file, remaining_extensions),
+    ('image', "Reading image", specify_img_method_of_reading_the_file, img_extensions),
+    ('pdf', "Reading PDF", specify_pdf_method_of_reading_the_file, pdf_extensions),
+    ('archive', "Extracting archive", specify_archive_method_of_reading_the_file, archive_extensions),
+    ('email', "Reading email", specify_email_method_of_reading_the_file, email_extensions),
+)
+
+_ext_dispatch = {}
+_ext_dispatch_version = None
+
+
+def _get_ext_dispatch():
+    """Extension -> (kind, label, reader) map, rebuilt when the extension registry changes"""
+    global _ext_dispatch, _ext_dispatch_version
+    version = get_registry_version()
+    if version != _ext_dispatch_version:
+        dispatch = {}
+        for kind, label, reader, extensions in reversed(_READERS):
+            for ext in extensions():
+                dispatch[ext] = (kind, label, reader)
+        _ext_dispatch, _ext_dispatch_version = dispatch, version
+    return _ext_dispatch
 
-_extraction_lock = threading.Lock()
 
-def _process_extracted_files(extraction_path, extraction_type, parent_file, collect, depth):
-    """Process extracted files from archives/emails (thread-safe)"""
+@functools.lru_cache(maxsize=64)
+def _lookup_handler(extension, registry_version):
+    """
+    Cached (kind, label, reader) for a raw extension, or None if unsupported
     
-    # Ensure only one thread processes each extraction at a time
-    with _extraction_lock:
-        logger.info(f"{'─'*70}")
-        logger.info(f"📦 PROCESSING EXTRACTED FILES FROM {extraction_type.upper()}")
-        logger.info(f"{'─'*70}")
-        logger.info(f"Source:        {os.path.basename(parent_file)}")
-        logger.info(f"Location:      {extraction_path}")
+    registry_version is part of the key so registering extensions invalidates
+    earlier lookups; the few distinct extensions of a run all stay cached.
+    """
+    return _get_ext_dispatch().get(extension.lower())
+
+
+class _PendingExtraction:
+    """An extracted archive/email folder whose files still have to be read"""
+    __slots__ = ("path", "extraction_type", "parent_file", "depth", "assign", "results", "done")
+    
+    def __init__(self, path, extraction_type, parent_file, depth):
+        self.path = path
+        self.extraction_type = extraction_type
+        self.parent_file = parent_file
+        self.depth = depth
+        # Puts the finished summary into the parent's result
+        self.assign = None
+        self.results = []
+        self.done = 0
+
+
+# The "Processing: n" line is redrawn at most this often (seconds)
+_PROGRESS_INTERVAL = 0.1
+_progress_lock = threading.Lock()
+_last_progress = 0.0
+
+
+def _start_extraction(extraction):
+    """Announce an extracted folder before its files are read"""
+    # One record keeps the banner together when several extractions run at once
+    logger.info(
+        f"{'─'*70}\n"
+        f"📦 PROCESSING EXTRACTED FILES FROM {extraction.extraction_type.upper()}\n"
+        f"{'─'*70}\n"
+        f"Source:        {os.path.basename(extraction.parent_file)}\n"
+        f"Location:      {extraction.path}"
+    )
     # Record extraction start
     record_command_line_action(
         "EXTRACTION_START",
-        f"Processing extracted files from {extraction_type}",
+        f"Processing extracted files from {extraction.extraction_type}",
         {
-            "extraction_type": extraction_type,
-            "parent_file": parent_file,
-            "extraction_path": extraction_path,
-            "depth": depth
+            "extraction_type": extraction.extraction_type,
+            "parent_file": extraction.parent_file,
+            "extraction_path": extraction.path,
+            "depth": extraction.depth
         }
     )
+
+
+def _read_extracted_file(extraction, idx, file_info, collect, slot_held):
+    """Read one extracted file; returns (result, pending extraction or None)"""
+    try:
+        file_name = file_info.get('name', 'unknown')
+        
+        # Record individual file processing
+        record_command_line_action(
+            "EXTRACTED_FILE_PROCESSING",
+            f"Processing extracted file {idx}: {file_name}",
+            {
+                "extraction_type": extraction.extraction_type,
+                "parent_file": extraction.parent_file,
+                "file_name": file_name,
+                "file_path": file_info.get('path', 'unknown'),
+                "progress": idx
+            }
+        )
+        
+        outcome = _read_file(file_info, collect, extraction.depth + 1)
+    finally:
+        if slot_held:
+            _extraction_slots.release()
     
-    tree = read_tree(extraction_path)
-    file_list = [item for item in tree if item.get('type') == 'FILE']
-    
-    print(f"Total Files:   {len(file_list)}")
-    print(f"{'─'*70}\n")
+    global _last_progress
+    now = time.monotonic()
+    with _progress_lock:
+        extraction.done += 1
+        if now - _last_progress >= _PROGRESS_INTERVAL:
+            _last_progress = now
+            print(f"Processing: {extraction.done} - {file_name}", end='\r')
+    return outcome
+
+
+def _finish_extraction(extraction):
+    """Summarize the results of an extracted folder into its parent's result"""
+    extraction_type = extraction.extraction_type
+    parent_file = extraction.parent_file
+    extraction_path = extraction.path
+    total_files = len(extraction.results)
     
-    if not file_list:
+    if not total_files:
         record_command_line_action(
             "EXTRACTION_COMPLETE",
             f"No files extracted from {extraction_type}",
@@ -85,56 +189,41 @@ def _process_extracted_files(extraction_path, extraction_type, parent_file, coll
                 "extracted_files_count": 0
             }
         )
-        return {
+        extraction.assign({
             f"{extraction_type}_info": {
                 "extraction_path": extraction_path,
                 "extracted_files_count": 0
             },
             "extracted_files": []
-        }
+        })
+        return
     
     extracted_results = []
+    # Per-file entries for the completion record, built in the same pass
+    summaries = []
     successful_extractions = 0
     failed_extractions = 0
     
-    for idx, file_info in enumerate(file_list, 1):
-        file_name = file_info.get('name', 'unknown')
-        print(f"Processing: {idx}/{len(file_list)} - {file_name}", end='\r')
-        
-        # Record individual file processing
-        record_command_line_action(
-            "EXTRACTED_FILE_PROCESSING",
-            f"Processing extracted file {idx}/{len(file_list)}: {file_name}",
-            {
-                "extraction_type": extraction_type,
-                "parent_file": parent_file,
-                "file_name": file_name,
-                "file_path": file_info.get('path', 'unknown'),
-                "progress": f"{idx}/{len(file_list)}"
-            }
-        )
-        
-        result = main_specify_method_of_reading_the_file(
-            file_info,
-            collect=collect,
-            depth=depth + 1
-        )
-        
+    for result in extraction.results:
         if result:
             extracted_results.append(result)
             # Check if processing was successful
             content = result.get("Content", {})
-            if content and not content.get("error"):
+            success = bool(content) and not content.get("error")
+            if success:
                 successful_extractions += 1
             else:
                 failed_extractions += 1
+            summaries.append({
+                "file_path": result.get("File_Path", "unknown"),
+                "success": not (content or {}).get("error"),
+                "processing_time": result.get("Processing_Time", 0)
+            })
         else:
             failed_extractions += 1
     
-    print(f"\n✓ Completed processing {len(extracted_results)}/{len(file_list)} files\n")
-    
     # Record extraction completion with detailed results
-    success_rate = (len(extracted_results) / len(file_list) * 100) if file_list else 0.0
+    success_rate = (len(extracted_results) / total_files * 100) if total_files else 0.0
     record_command_line_action(
         "EXTRACTION_COMPLETE",
         f"Completed processing extracted files from {extraction_type}",
@@ -142,43 +231,97 @@ def _process_extracted_files(extraction_path, extraction_type, parent_file, coll
             "extraction_type": extraction_type,
             "parent_file": parent_file,
             "extraction_path": extraction_path,
-            "total_files": len(file_list),
+            "total_files": total_files,
             "processed_files": len(extracted_results),
             "successful": successful_extractions,
             "failed": failed_extractions,
             "success_rate": f"{success_rate:.1f}%",
-            "extracted_files": [
-                {
-                    "file_path": r.get("File_Path", "unknown"),
-                    "success": not bool(r.get("Content", {}).get("error")),
-                    "processing_time": r.get("Processing_Time", 0)
-                }
-                for r in extracted_results
-            ]
+            "extracted_files": summaries
         }
     )
     
-    return {
+    extraction.assign({
         f"{extraction_type}_info": {
             "extraction_path": extraction_path,
-            "total_files": len(file_list),
+            "total_files": total_files,
             "processed_files": len(extracted_results),
-            "success_rate": f"{success_rate:.1f}%" if file_list else "0%"
+            "success_rate": f"{success_rate:.1f}%" if total_files else "0%"
         },
         "extracted_files": extracted_results
-    }
+    })
+
 
-def _process_email_result(email_result, file_path, collect, depth):
+def _read_extracted_tree(root, collect, max_workers=None):
+    """
+    Read every file below an extracted folder, breadth-first.
+    
+    All folders of one nesting depth are walked and their files read on one
+    thread pool; archives/emails found there queue their own folder for the
+    next depth, so nesting never recurses and no reader waits on its children.
+    Summaries are filled in bottom-up once the deepest level is read.
+    At most max_workers files (default MAX_EXTRACTION_WORKERS) are read at once.
+    """
+    extractions = []
+    level = [root]
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers or MAX_EXTRACTION_WORKERS, MAX_EXTRACTION_WORKERS)),
+        thread_name_prefix="extracted"
+    )
+    try:
+        while level:
+            extractions.extend(level)
+            next_level = []
+            
+            def collect_outcome(extraction, index, outcome):
+                result, pending = outcome
+                extraction.results[index] = result
+                if pending is not None:
+                    next_level.append(pending)
+            
+            # Files are read while their folder is still being walked; results
+            # keep the walk order regardless of completion order
+            futures = {}
+            for extraction in level:
+                _start_extraction(extraction)
+                results = extraction.results
+                for file_info in iter_tree(extraction.path):
+                    if file_info.get('type') != 'FILE':
+                        continue
+                    results.append(None)
+                    index = len(results) - 1
+                    if _extraction_slots.acquire(blocking=False):
+                        future = executor.submit(_read_extracted_file, extraction, index + 1, file_info, collect, True)
+                        futures[future] = (extraction, index)
+                    else:
+                        collect_outcome(extraction, index, _read_extracted_file(extraction, index + 1, file_info, collect, False))
+                # The count is known once the folder's walk is done
+                print(f"Total Files:   {len(results)}")
+                print(f"{'─'*70}\n")
+            
+            for future in as_completed(futures):
+                extraction, index = futures[future]
+                collect_outcome(extraction, index, future.result())
+            level = next_level
+    finally:
+        executor.shutdown(wait=True)
+    
+    for extraction in reversed(extractions):
+        _finish_extraction(extraction)
+
+
+def _process_email_result(email_result, file_path):
     """
     Process email results with message content and attachments separated
     
-    Returns:
+    Returns (content, attachment folder or None):
     - message: Email metadata and body content (returned directly)
     - attachments: Processed independently through the file routing system
+      (filled in once the attachment folder has been read)
     """
     
-    if not email_result or isinstance(email_result, dict) and email_result.get("error"):
-        return email_result
+    # specify_email_method_of_reading_the_file always returns a dict
+    if not email_result or email_result.get("error"):
+        return email_result, None
     
     # Extract message content
     message_content = email_result.get("message") or email_result.get("messages")
@@ -195,33 +338,29 @@ def _process_email_result(email_result, file_path, collect, depth):
         }
     }
     
-    # Process attachments if they exist
-    if has_attachments and extraction_path and os.path.exists(extraction_path):
+    # Process attachments if they exist (the reader created extraction_path before returning it)
+    if has_attachments and extraction_path:
         print(f"\n📎 Processing email attachments from: {os.path.basename(file_path)}")
-        
-        attachments_result = _process_extracted_files(
-            extraction_path,
-            'email_attachment',
-            file_path,
-            collect,
-            depth
-        )
-        
-        final_result["attachments"] = attachments_result
-    else:
-        final_result["attachments"] = {
-            "email_attachment_info": {
-                "extraction_path": extraction_path or "N/A",
-                "extracted_files_count": 0
-            },
-            "extracted_files": []
-        }
+        final_result["attachments"] = None
+        return final_result, extraction_path
     
-    return final_result
+    final_result["attachments"] = {
+        "email_attachment_info": {
+            "extraction_path": extraction_path or "N/A",
+            "extracted_files_count": 0
+        },
+        "extracted_files": []
+    }
+    return final_result, None
 
 
-def main_specify_method_of_reading_the_file(file_info, collect=True, depth=0):
-    """Read a file using appropriate reader and optionally collect results"""
+def _read_file(file_info, collect, depth):
+    """
+    Read one file without descending into archives/emails
+    
+    Returns (result, pending extraction or None); the pending extracted folder
+    is read by _read_extracted_tree, which fills in the result's summary.
+    """
     
     if depth > MAX_RECURSION_DEPTH:
         file_path = file_info.get('path', 'unknown')
@@ -235,131 +374,108 @@ def main_specify_method_of_reading_the_file(file_info, collect=True, depth=0):
         
 
         
-        return result
+        return result, None
     
     if file_info.get('type') != 'FILE':
-        return None
+        return None, None
     
     file_path = file_info.get('path')
-    extension = file_info.get('extension', '').lower()
+    extension = file_info.get('extension', '')
     
     start_time = time.time()
     
+    def error_result(message):
+        return create_standardized_result(file_path, {"error": message}, time.time() - start_time), None
+    
     if not extension:
         print(f"⚠ No extension found for: {file_path}")
-        
-        processing_time = time.time() - start_time
-        result = create_standardized_result(
-            file_path, 
-            {"error": "No file extension found"},
-            processing_time
-        )
-        
-
-        
-        return result
+        return error_result("No file extension found")
     
     content_data = None
+    # Extracted folder still to be read, and where its summary goes: the whole
+    # Content for archives, Content["attachments"] for emails
+    extraction_path = None
+    extraction_type = None
     
     try:
         # Direct processing - no threading
-        if extension in office_extensions():
-            content_data = print_execution_time(
-                f"Reading office file: {os.path.basename(file_path)}",
-                specify_office_method_of_reading_the_file,
-                file_info
-            )
-        
-        elif extension in remaining_extensions():
-            content_data = print_execution_time(
-                f"Reading file: {os.path.basename(file_path)}",
-                specify_remaining_method_of_reading_the_file,
-                file_info
-            )
-        
-        elif extension in img_extensions():
-            content_data = print_execution_time(
-                f"Reading image: {os.path.basename(file_path)}",
-                specify_img_method_of_reading_the_file,
-                file_info
-            )
+        entry = _lookup_handler(extension, get_registry_version())
+        if entry is None:
+            # Unrecognized file type - return result with error instead of None
+            # This ensures the file is counted and tracked
+            return error_result(f"Unsupported file type: {extension.lower()}")
         
-        elif extension in pdf_extensions():
-            content_data = print_execution_time(
-                f"Reading PDF: {os.path.basename(file_path)}",
-                specify_pdf_method_of_reading_the_file,
-                file_info
-            )
+        kind, label, reader = entry
+        data = print_execution_time(
+            f"{label}: {file_info.get('name') or os.path.basename(file_path)}",
+            reader,
+            file_info
+        )
         
-        elif extension in archive_extensions():
-            archive_result = print_execution_time(
-                f"Extracting archive: {os.path.basename(file_path)}",
-                specify_archive_method_of_reading_the_file,
-                file_info
-            )
+        if kind == 'archive':
+            archive_result = data
             extraction_path = archive_result.get("extraction_path") if archive_result else None
             
-            if extraction_path and isinstance(extraction_path, str) and os.path.exists(extraction_path):
-                content_data = _process_extracted_files(
-                    extraction_path,
-                    'archive',
-                    file_path,
-                    collect,
-                    depth
-                )
+            # Only returned once the extractor has created the folder
+            if extraction_path and isinstance(extraction_path, str):
+                # Replaced by the extraction summary once the folder is read
+                content_data = {}
+                extraction_type = 'archive'
             else:
+                extraction_path = None
                 content_data = {"error": "Failed to extract archive"}
 
-        elif extension in email_extensions():
+        elif kind == 'email':
             # EMAIL HANDLING: Separate message content from attachments
-            email_result = print_execution_time(
-                f"Reading email: {os.path.basename(file_path)}",
-                specify_email_method_of_reading_the_file,
-                file_info
-            )
+            email_result = data
             
             if email_result:
-                content_data = _process_email_result(
+                content_data, extraction_path = _process_email_result(
                     email_result,
-                    file_path,
-                    collect,
-                    depth
+                    file_path
                 )
+                extraction_type = 'email_attachment'
             else:
                 content_data = {"error": "No email data"}
         
         else:
-            # Unrecognized file type - return result with error instead of None
-            # This ensures the file is counted and tracked
-            processing_time = time.time() - start_time
-            result = create_standardized_result(
-                file_path,
-                {"error": f"Unsupported file type: {extension}"},
-                processing_time
-            )
-            return result
+            content_data = data
             
     except Exception as e:
         print(f"✗ Error processing {file_path}: {str(e)}")
         content_data = {"error": str(e)}
+        extraction_path = None
     
     if content_data is None:
         # If content_data is None, create a result with error
         # This ensures all files are tracked, even if processing failed
-        processing_time = time.time() - start_time
-        result = create_standardized_result(
-            file_path,
-            {"error": "File processing returned no content"},
-            processing_time
-        )
-        return result
+        return error_result("File processing returned no content")
     
     processing_time = time.time() - start_time
     result = create_standardized_result(file_path, content_data, processing_time)
     
+    pending = None
+    if extraction_path:
+        pending = _PendingExtraction(extraction_path, extraction_type, file_path, depth)
+        target, key = (content_data, "attachments") if extraction_type == 'email_attachment' else (result, "Content")
+        pending.assign = functools.partial(target.__setitem__, key)
+    
     # Calculate and display file processing metrics
     calculate_file_processing_metrics(file_info, result)
     
+    return result, pending
+
+
+def main_specify_method_of_reading_the_file(file_info, collect=True, depth=0, max_workers=None):
+    """
+    Read a file using appropriate reader and optionally collect results
+    
+    max_workers caps how many files extracted from it are read at once
+    (default and upper bound: MAX_EXTRACTION_WORKERS).
+    """
+    result, pending = _read_file(file_info, collect, depth)
+    if pending is not None:
+        _read_extracted_tree(pending, collect, max_workers)
     return result
 
 
@@ -1,12 +1,26 @@
 import bz2
+import functools
 import gzip
 import os
-from pathlib import Path
 import shutil
 import tarfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from core.path_utils import get_extraction_name_file
 
+# Chunk size for decompressing single-file .gz/.bz2 archives
+_COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# ZIP archives with more members than this are extracted on several threads
+# (zlib/bz2/lzma release the GIL while decompressing)
+_PARALLEL_ZIP_MIN_MEMBERS = 16
+_ZIP_WORKERS = min(8, os.cpu_count() or 1)
+
+# Extraction filters (Python 3.12, backported to 3.8.17+/3.11.4+) also skip the
+# deprecation warning for unfiltered extraction
+_TAR_FILTER_SUPPORTED = hasattr(tarfile, 'data_filter')
+
 
 def extensions_type_extract():
     """Return set of supported archive extensions"""
@@ -15,6 +29,10 @@ def extensions_type_extract():
 
 
 def specify_archive_method_of_reading_the_file(file_info, logger=None):
+    """
+    Extract an archive; returns {"extraction_path": ...} for the folder the
+    extractor created (callers need not check it exists) or an "error" dict
+    """
 
     if not os.path.exists(file_info["path"]):
         print(f"✗ File not found: {file_info['path']}")
@@ -22,28 +40,19 @@ def specify_archive_method_of_reading_the_file(file_info, logger=None):
         return {"error": "File not found", "path": file_info["path"]}
     
     file_path = str(file_info["path"])
-    file_lower = file_path.lower()
+    # Only the suffix is matched, so only the tail of the path is lowercased
+    file_lower = file_path[-_MAX_SUFFIX_LEN:].lower()
     
     try:
-        extraction_path = None
-        
-        if file_lower.endswith('.zip'):
-            extraction_path = extract_zip(file_path)
-        elif file_lower.endswith('.tar') or file_lower.endswith('.tar.gz') or file_lower.endswith('.tar.bz2') or file_lower.endswith('.tar.xz'):
-            extraction_path = extract_tar(file_path)
-        elif file_lower.endswith('.gz'):
-            extraction_path = extract_gz(file_path)
-        elif file_lower.endswith('.bz2'):
-            extraction_path = extract_bz2(file_path)
-        elif file_lower.endswith('.rar'):
-            extraction_path = extract_rar(file_path)
-        elif file_lower.endswith('.7z'):
-            extraction_path = extract_7z(file_path)
-        else:
+        if not file_lower.endswith(_ARCHIVE_SUFFIXES):
             print(f"✗ Unsupported file type: {file_path}")
 
             return {"error": "Unsupported archive type", "path": file_path}
         
+        # Longest suffix first, so .tar.gz is not taken for a plain .gz
+        extract = next(handler for suffix, handler in _ARCHIVE_HANDLERS if file_lower.endswith(suffix))
+        extraction_path = extract(file_path)
+        
         # STANDARDIZED: Always return dict
         if extraction_path:
             return {
@@ -69,43 +78,82 @@ def extract_zip(file_path):
     os.makedirs(extract_to, exist_ok=True)
     
     with zipfile.ZipFile(file_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_to)
+        members = zip_ref.infolist()
+        if len(members) <= _PARALLEL_ZIP_MIN_MEMBERS or _ZIP_WORKERS < 2:
+            zip_ref.extractall(extract_to)
+        else:
+            _extract_zip_parallel(file_path, members, extract_to)
     print(f"✓ Extracted {file_path} to {extract_to}/")
     return extract_to
 
 
+def _extract_zip_parallel(file_path, members, extract_to):
+    """Extract ZIP members on a thread pool, one ZipFile handle per thread"""
+    local = threading.local()
+    handles = []
+    handles_lock = threading.Lock()
+    
+    def extract_member(member):
+        zip_ref = getattr(local, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = local.zip_ref = zipfile.ZipFile(file_path, 'r')
+            with handles_lock:
+                handles.append(zip_ref)
+        try:
+            zip_ref.extract(member, extract_to)
+        except FileExistsError:
+            # Another thread created a shared parent folder first
+            zip_ref.extract(member, extract_to)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=_ZIP_WORKERS, thread_name_prefix="unzip") as executor:
+            # list() re-raises the first extraction error
+            list(executor.map(extract_member, members))
+    finally:
+        for zip_ref in handles:
+            zip_ref.close()
+
+
 def extract_tar(file_path):
     """Extract TAR files (.tar, .tar.gz, .tar.bz2, .tar.xz)"""
     # Determine extension to use for folder name
-    if file_path.endswith('.tar.gz'):
-        extension = '.tar.gz'
-    elif file_path.endswith('.tar.bz2'):
-        extension = '.tar.bz2'
-    elif file_path.endswith('.tar.xz'):
-        extension = '.tar.xz'
-    else:
-        extension = '.tar'
+    extension = '.tar'
+    if file_path.endswith(_COMPRESSED_TAR_SUFFIXES):
+        extension = next(suffix for suffix in _COMPRESSED_TAR_SUFFIXES if file_path.endswith(suffix))
     
     extract_to = get_extraction_name_file(file_path, extension)
     os.makedirs(extract_to, exist_ok=True)
     
-    with tarfile.open(file_path, 'r:*') as tar_ref:
-        tar_ref.extractall(extract_to)
+    # Stream mode extracts members as they are decoded instead of indexing the whole archive first
+    with tarfile.open(file_path, 'r|*') as tar_ref:
+        if _TAR_FILTER_SUPPORTED:
+            tar_ref.extractall(extract_to, filter=_skip_unsafe_member)
+        else:
+            tar_ref.extractall(extract_to)
     print(f"✓ Extracted {file_path} to {extract_to}/")
     return extract_to
 
 
+def _skip_unsafe_member(member, dest_path):
+    """'data' extraction filter that skips unsafe members instead of aborting the extraction"""
+    try:
+        return tarfile.data_filter(member, dest_path)
+    except tarfile.FilterError as e:
+        print(f"⚠ Skipped unsafe tar member: {e}")
+        return None
+
+
 def extract_gz(file_path):
     """Extract GZ files (single file compression)"""
     extract_to = get_extraction_name_file(file_path, '.gz')
     os.makedirs(extract_to, exist_ok=True)
     
     # Output file inside the folder
-    output_file = os.path.join(extract_to, Path(file_path).stem)
+    output_file = os.path.join(extract_to, os.path.splitext(os.path.basename(file_path))[0])
     
     with gzip.open(file_path, 'rb') as f_in:
         with open(output_file, 'wb') as f_out:
-            shutil.copyfileobj(f_in, f_out)
+            shutil.copyfileobj(f_in, f_out, _COPY_BUFFER_SIZE)
     print(f"✓ Extracted {file_path} to {extract_to}/")
     return extract_to
 
@@ -116,35 +164,53 @@ def extract_bz2(file_path):
     os.makedirs(extract_to, exist_ok=True)
     
     # Output file inside the folder
-    output_file = os.path.join(extract_to, Path(file_path).stem)
+    output_file = os.path.join(extract_to, os.path.splitext(os.path.basename(file_path))[0])
     
     with bz2.open(file_path, 'rb') as f_in:
         with open(output_file, 'wb') as f_out:
-            shutil.copyfileobj(f_in, f_out)
+            shutil.copyfileobj(f_in, f_out, _COPY_BUFFER_SIZE)
     print(f"✓ Extracted {file_path} to {extract_to}/")
     return extract_to
 
 
-def extract_rar(file_path):
-    """Extract RAR files (requires rarfile package and UnRAR tool)"""
+@functools.lru_cache(maxsize=1)
+def _resolve_unrar():
+    """Import rarfile and point it at an UnRAR tool once (None if rarfile is missing)"""
     try:
         import rarfile
-        
-        # Set UnRAR tool path for Windows
-        rarfile.UNRAR_TOOL = "unrar"
-        
-        # Try to find WinRAR installation
-        winrar_paths = [
-            r"C:\Users\SOLO\Downloads\UnRAR.exe",
-            r"C:\Program Files\WinRAR\UnRAR.exe",
-            r"C:\Program Files (x86)\WinRAR\UnRAR.exe"
-        ]
-        for path in winrar_paths:
-            if os.path.exists(path):
-                rarfile.UNRAR_TOOL = path
-                break
-        
     except ImportError:
+        return None
+    
+    # Set UnRAR tool path for Windows
+    rarfile.UNRAR_TOOL = "unrar"
+    
+    # Try to find WinRAR installation
+    winrar_paths = [
+        r"C:\Users\SOLO\Downloads\UnRAR.exe",
+        r"C:\Program Files\WinRAR\UnRAR.exe",
+        r"C:\Program Files (x86)\WinRAR\UnRAR.exe"
+    ]
+    for path in winrar_paths:
+        if os.path.exists(path):
+            rarfile.UNRAR_TOOL = path
+            break
+    return rarfile
+
+
+@functools.lru_cache(maxsize=1)
+def _import_py7zr():
+    """Import py7zr once (None if it is missing)"""
+    try:
+        import py7zr
+    except ImportError:
+        return None
+    return py7zr
+
+
+def extract_rar(file_path):
+    """Extract RAR files (requires rarfile package and UnRAR tool)"""
+    rarfile = _resolve_unrar()
+    if rarfile is None:
         print("⚠ rarfile not installed. Install with: pip install rarfile")
         return None
     
@@ -168,9 +234,8 @@ def extract_rar(file_path):
 
 def extract_7z(file_path):
     """Extract 7Z files (requires py7zr package)"""
-    try:
-        import py7zr
-    except ImportError:
+    py7zr = _import_py7zr()
+    if py7zr is None:
         print("⚠ py7zr not installed. Install with: pip install py7zr")
         return None
     
@@ -185,3 +250,21 @@ def extract_7z(file_path):
     except Exception as e:
         print(f"✗ Error extracting 7z file: {str(e)}")
         return None
+
+
+_COMPRESSED_TAR_SUFFIXES = ('.tar.gz', '.tar.bz2', '.tar.xz')
+
+# Suffix -> extractor, longest suffix first
+_ARCHIVE_HANDLERS = (
+    ('.tar.bz2', extract_tar),
+    ('.tar.gz', extract_tar),
+    ('.tar.xz', extract_tar),
+    ('.zip', extract_zip),
+    ('.tar', extract_tar),
+    ('.bz2', extract_bz2),
+    ('.rar', extract_rar),
+    ('.gz', extract_gz),
+    ('.7z', extract_7z),
+)
+_ARCHIVE_SUFFIXES = tuple(suffix for suffix, _ in _ARCHIVE_HANDLERS)
+_MAX_SUFFIX_LEN = max(len(suffix) for suffix in _ARCHIVE_SUFFIXES)
@@ -7,14 +7,55 @@ Email file readers - Enhanced Version
 
 from email import policy
 import email
-from email.parser import BytesParser
+from email.header import Header, decode_header, make_header
+from email.message import Message
+from email.parser import BytesFeedParser
+import functools
 import json
+import logging
+import mmap
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from core.detect_binanry_utils import detect_file_type , get_filename_with_correct_extension
 from core.file_utils import sanitize_filename
 from core.path_utils import get_extraction_name_file
 
+logger = logging.getLogger(__name__)
+
+try:
+    import html2text as _html2text
+except ImportError:
+    _html2text = None
+
+try:
+    import charset_normalizer as _charset_normalizer
+except ImportError:
+    _charset_normalizer = None
+
+# Fallback HTML-to-text conversion when html2text is not installed. Same
+# matches as '<[^<]+?>', but without the lazy quantifier the scan never
+# steps back: one char after '<', then anything up to the first '>'
+_TAG_RE = re.compile('<[^<][^<>]*>')
+
+# Messages are fed to the parser in blocks of this size instead of being read whole
+_PARSE_CHUNK_SIZE = 64 * 1024
+
+# Start of each message in an mbox file (the From_ separator line)
+_MBOX_FROM_RE = re.compile(rb'^From ', re.MULTILINE)
+
+# In-memory attachments are written straight to the descriptor; streamed PST
+# attachments go through a buffered file of this size
+_WRITE_BUFFER_SIZE = 1024 * 1024
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# MBOX/PST attachments are written on this many threads while the next ones are decoded
+_ATTACHMENT_WRITERS = 4
+
+# PST attachments larger than this are read and written in chunks of this size
+_PST_CHUNK_SIZE = 1024 * 1024
+
 
 def extensions_type_extract():
     """Return set of supported email extensions"""
@@ -23,6 +64,7 @@ def extensions_type_extract():
 
 
 def specify_email_method_of_reading_the_file(file_info, logger=None):
+    """Read an email file; always returns a dict (with an "error" key on failure)"""
     file_path = file_info.get("path")
     
     if not file_path or not os.path.exists(file_path):
@@ -30,38 +72,21 @@ def specify_email_method_of_reading_the_file(file_info, logger=None):
         return {"error": "File not found", "path": file_path}
     
     file_path = str(file_path)
-    file_lower = file_path.lower()
+    handler = _EMAIL_HANDLERS.get(os.path.splitext(file_path)[1].lower())
     
     try:
-        result = None
-        
-        if file_lower.endswith('.msg'):
-            result = extract_msg(file_path)
-            if result and 'error' not in result:
-                result["email_type"] = "msg"
-                
-        elif file_lower.endswith('.eml'):
-            result = extract_eml(file_path)
-            if result and 'error' not in result:
-                result["email_type"] = "eml"
-            
-        elif file_lower.endswith('.mbox'):
-            result = extract_mbox(file_path)
-            if result and 'error' not in result:
-                result["email_type"] = "mbox"
-                
-        elif file_lower.endswith('.pst'):
-            result = extract_pst_pypff(file_path)
-            if result and 'error' not in result:
-                result["email_type"] = "pst"
-        else:
+        if handler is None:
             print(f"✗ Unsupported file type: {file_path}")
-            result = {"error": "Unsupported email type", "path": file_path}
+            return {"error": "Unsupported email type", "path": file_path}
+        
+        extract, email_type = handler
+        result = extract(file_path)
         
         # If extraction failed, ensure we have an error result
-        if not result or 'error' in result:
-            if not result:
-                result = {"error": "Email extraction failed", "path": file_path}
+        if not result:
+            result = {"error": "Email extraction failed", "path": file_path}
+        elif 'error' not in result:
+            result["email_type"] = email_type
         
         return result
         
@@ -70,6 +95,212 @@ def specify_email_method_of_reading_the_file(file_info, logger=None):
         return {"error": str(e), "path": file_path}
 
 
+def _parse_message_range(buffer, start, stop, message_policy=policy.compat32):
+    """Parse the email in buffer[start:stop], feeding the parser chunk by chunk"""
+    parser = BytesFeedParser(policy=message_policy)
+    for offset in range(start, stop, _PARSE_CHUNK_SIZE):
+        parser.feed(buffer[offset:min(offset + _PARSE_CHUNK_SIZE, stop)])
+    return parser.close()
+
+
+def _decoded_header(value, default=''):
+    """
+    Decode RFC 2047 encoded words in a compat32 header value. Only the few
+    headers that are read get decoded, instead of policy.default building
+    structured objects for every header while parsing.
+    
+    Raw 8-bit (RFC 6532 UTF-8) values come back from compat32 as a Header
+    tagged unknown-8bit, or as a surrogate-escaped str for parameters such as
+    filenames; like policy.default they are decoded as UTF-8, bad bytes replaced.
+    """
+    if value is None:
+        return default
+    try:
+        if isinstance(value, Header):
+            value = ''.join(
+                chunk.decode('utf-8' if charset in (None, 'unknown-8bit') else charset, errors='replace')
+                if isinstance(chunk, bytes) else chunk
+                for chunk, charset in decode_header(value)
+            )
+        elif not value.isascii():
+            value = value.encode('utf-8', 'surrogateescape').decode('utf-8', errors='replace')
+        return str(make_header(decode_header(value)))
+    except Exception:
+        return str(value)
+
+
+def _attachment_filename(part):
+    """part.get_filename() of a compat32 part, decoded like policy.default would"""
+    filename = part.get_filename()
+    if filename and '\ufffd' in filename:
+        # compat32 replaces raw 8-bit parameter bytes; re-read the parameters
+        # from the raw headers decoded as UTF-8
+        decoded = Message()
+        for name, value in part.raw_items():
+            if name.lower() in ('content-disposition', 'content-type'):
+                decoded[name] = value.encode('utf-8', 'surrogateescape').decode('utf-8', errors='replace')
+        filename = decoded.get_filename() or filename
+    return _decoded_header(filename)
+
+
+def _parse_message_file(f, message_policy=policy.compat32):
+    """Parse an email from a binary file through a read-only memory map"""
+    # Empty files cannot be mapped
+    if os.fstat(f.fileno()).st_size == 0:
+        return _parse_message_range(b'', 0, 0, message_policy)
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _parse_message_range(mm, 0, len(mm), message_policy)
+
+
+def _html_to_text(html, converter=None):
+    """Convert an HTML body to text with html2text (or by stripping tags)"""
+    if _html2text is None:
+        return _TAG_RE.sub('', html)
+    if converter is not None:
+        return converter.handle(html)
+    return _html2text.html2text(html)
+
+
+def _decode_body(raw, charset=None):
+    """
+    Decode a body with its declared charset, else as UTF-8, else with the
+    encoding charset_normalizer detects from its head (replacing bad bytes)
+    """
+    if charset:
+        try:
+            return raw.decode(charset, errors='replace')
+        except LookupError:
+            pass
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    if _charset_normalizer is not None:
+        best = _charset_normalizer.from_bytes(raw[:4096]).best()
+        if best is not None:
+            try:
+                return raw.decode(best.encoding, errors='replace')
+            except LookupError:
+                pass
+    return raw.decode('utf-8', errors='replace')
+
+
+def _decode_text_part(part, content_type):
+    """Stripped text of a text/plain or text/html body part ('' if empty or undecodable)"""
+    try:
+        raw_content = part.get_payload(decode=True)
+        if not raw_content:
+            return ''
+        text_content = _decode_body(raw_content, part.get_content_charset())
+        
+        # Convert HTML to plaintext if needed
+        if content_type == 'text/html':
+            text_content = _html_to_text(text_content)
+        return text_content.strip()
+    except Exception as e:
+        logger.warning(f"Could not decode text part: {str(e)}")
+        return ''
+
+
+def _stem_suffix(filename):
+    """Split a bare filename like Path(filename).stem/.suffix, without building a Path"""
+    dot = filename.rfind('.')
+    if 0 < dot < len(filename) - 1:
+        return filename[:dot], filename[dot:]
+    return filename, ''
+
+
+def _name_key(filename):
+    """used_names key for a filename; case-folded, since Windows and macOS ignore case"""
+    return filename.casefold()
+
+
+def _existing_names(folder):
+    """Seed a used_names dict (see _unique_name) with the files already in folder"""
+    try:
+        with os.scandir(folder) as entries:
+            return {_name_key(entry.name): 1 for entry in entries}
+    except OSError:
+        return {}
+
+
+def _unique_name(filename, used_names):
+    """
+    Return filename, or filename with a _N counter if it is already taken.
+    used_names maps every name handed out for one folder (by _name_key) to
+    the next counter to try, so duplicates are resolved without probing the disk.
+    """
+    key = _name_key(filename)
+    counter = used_names.get(key, 0)
+    name = filename
+    if counter:
+        base_name, extension = _stem_suffix(filename)
+        name = f"{base_name}_{counter}{extension}"
+        while _name_key(name) in used_names:
+            counter += 1
+            name = f"{base_name}_{counter}{extension}"
+        used_names[_name_key(name)] = 1
+    used_names[key] = counter + 1
+    return name
+
+
+def _iter_mbox_messages(file_path):
+    """Yield the messages of an mbox file, split on From_ lines of a memory map"""
+    with open(file_path, 'rb') as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = None
+            for match in _MBOX_FROM_RE.finditer(mm):
+                if start is not None:
+                    yield _parse_message_range(mm, start, match.start())
+                start = match.start()
+            if start is not None:
+                yield _parse_message_range(mm, start, len(mm))
+
+
+def _write_attachment(path, data):
+    """Write an attachment payload to path without copying it"""
+    view = memoryview(data)
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        # os.write may write less than asked for
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _stream_pst_attachment(attachment, path, head, size):
+    """Write a PST attachment chunk by chunk, starting with its already-read head"""
+    with open(path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(head)
+        remaining = size - len(head)
+        while remaining > 0:
+            chunk = attachment.read_buffer(min(_PST_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            f.write(chunk)
+            remaining -= len(chunk)
+
+
+def _save_attachment(folder_prefix, original_filename, payload, used_names, write=_write_attachment):
+    """
+    Name an attachment after its detected type, make the name unique in its
+    folder and write it to folder_prefix (the folder path plus os.sep) + name.
+    write(filepath, payload) may also queue the write (or stream the rest of a
+    partly read attachment); its return value is passed back.
+    
+    Returns (filename, detected_type, write result).
+    """
+    detected_type = detect_file_type(payload)
+    filename = sanitize_filename(original_filename)
+    filename = get_filename_with_correct_extension(filename, payload, detected_type)
+    filename = _unique_name(filename, used_names)
+    return filename, detected_type, write(folder_prefix + filename, payload)
+
+
 def extract_eml(filepath):
     """
     Extract EML file with complete separation:
@@ -83,102 +314,66 @@ def extract_eml(filepath):
             return {"error": "File not found", "filepath": filepath}
 
         with open(filepath, 'rb') as f:
-            msg = BytesParser(policy=policy.default).parse(f)
+            msg = _parse_message_file(f)
 
         # Create extraction folder for attachments only
         extract_to = get_extraction_name_file(filepath, '.eml')
         os.makedirs(extract_to, exist_ok=True)
+        # Per-attachment lines (and the extra type detection) only at DEBUG
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # -----------------------------------------
         # 1. EXTRACT MESSAGE METADATA + ALL BODY CONTENT (MERGED)
         # -----------------------------------------
         message = {
             "source_filepath": filepath,
-            "from": msg.get('From', ''),
-            "to": msg.get('To', ''),
-            "subject": msg.get('Subject', ''),
-            "date": msg.get('Date', ''),
-            "cc": msg.get('Cc', ''),
-            "bcc": msg.get('Bcc', ''),
-            "message_id": msg.get('Message-ID', ''),
+            "from": _decoded_header(msg.get('From')),
+            "to": _decoded_header(msg.get('To')),
+            "subject": _decoded_header(msg.get('Subject')),
+            "date": _decoded_header(msg.get('Date')),
+            "cc": _decoded_header(msg.get('Cc')),
+            "bcc": _decoded_header(msg.get('Bcc')),
+            "message_id": _decoded_header(msg.get('Message-ID')),
             "content": ""  # Single merged content string
         }
 
-        # Collect all text content parts
-        content_parts = []
-        
-        for part in msg.walk():
-            content_type = part.get_content_type()
-            
-            # Only process text content (not attachments)
-            if content_type in ['text/plain', 'text/html']:
-                disposition = part.get_content_disposition()
-                # Skip if it's an attachment
-                if disposition not in ['attachment', 'inline']:
-                    try:
-                        raw_content = part.get_payload(decode=True)
-                        if raw_content:
-                            text_content = raw_content.decode('utf-8', errors='ignore')
-                            
-                            # Convert HTML to plaintext if needed
-                            if content_type == "text/html":
-                                try:
-                                    import html2text
-                                    text_content = html2text.html2text(text_content)
-                                except ImportError:
-                                    import re
-                                    text_content = re.sub('<[^<]+?>', '', text_content)
-                            
-                            if text_content.strip():
-                                content_parts.append(text_content.strip())
-                    except Exception as e:
-                        print(f"  ⚠ Could not decode text part: {str(e)}")
-                        continue
-
-        # Merge all content parts with double newline separator
-        message["content"] = "\n\n".join(content_parts) if content_parts else ""
-
         # -----------------------------------------
-        # 2. EXTRACT ATTACHMENTS AS SEPARATE FILES
+        # 2. MERGE BODY CONTENT + SAVE ATTACHMENTS (SINGLE WALK)
         # -----------------------------------------
+        content_parts = []
         attachment_count = 0
+        used_names = _existing_names(extract_to)
+        folder_prefix = extract_to + os.sep
 
         for part in msg.walk():
+            content_type = part.get_content_type()
             disposition = part.get_content_disposition()
 
             if disposition in ['attachment', 'inline']:
-                original_filename = part.get_filename() or "unnamed"
+                original_filename = _attachment_filename(part) or "unnamed"
                 payload = part.get_payload(decode=True)
 
                 if not payload:
                     continue
 
-                # Detect correct file type and update filename
-                filename = sanitize_filename(original_filename)
-                filename = get_filename_with_correct_extension(filename, payload)
-
-                # Save attachment as physical file
-                filepath = os.path.join(extract_to, filename)
-                
-                # Handle duplicate filenames
-                counter = 1
-                base_name = Path(filename).stem
-                extension = Path(filename).suffix
-                while os.path.exists(filepath):
-                    filename = f"{base_name}_{counter}{extension}"
-                    filepath = os.path.join(extract_to, filename)
-                    counter += 1
-
-                # Write attachment to disk
-                with open(filepath, 'wb') as f:
-                    f.write(payload)
+                # Detect correct file type, update filename and save as physical file
+                filename, detected_type, _ = _save_attachment(folder_prefix, original_filename, payload, used_names)
                 
                 attachment_count += 1
-                detected_type = detect_file_type(payload)
-                if original_filename != filename:
-                    print(f"  ✓ Saved attachment: {filename} ({len(payload)} bytes) [detected: {detected_type}]")
-                else:
-                    print(f"  ✓ Saved attachment: {filename} ({len(payload)} bytes)")
+                if debug:
+                    if original_filename != filename:
+                        logger.debug(f"Saved attachment: {filename} ({len(payload)} bytes) [detected: {detected_type}]")
+                    else:
+                        logger.debug(f"Saved attachment: {filename} ({len(payload)} bytes)")
+
+            # Only process text content (not attachments)
+            elif content_type in ['text/plain', 'text/html']:
+                text_content = _decode_text_part(part, content_type)
+                if text_content:
+                    content_parts.append(text_content)
+
+        # Merge all content parts with double newline separator
+        message["content"] = "\n\n".join(content_parts) if content_parts else ""
 
         # -----------------------------------------
         # RETURN MESSAGE DATA + EXTRACTION PATH
@@ -217,6 +412,7 @@ def extract_msg(file_path):
     
     extract_to = get_extraction_name_file(file_path, '.msg')
     os.makedirs(extract_to, exist_ok=True)
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     try:
         msg = extract_msg.Message(file_path)
@@ -231,8 +427,7 @@ def extract_msg(file_path):
         # Add HTML body if different (converted to text)
         if hasattr(msg, 'htmlBody') and msg.htmlBody:
             try:
-                import html2text
-                html_text = html2text.html2text(msg.htmlBody)
+                html_text = _html_to_text(msg.htmlBody)
                 if html_text.strip() and html_text.strip() != content_parts[0] if content_parts else True:
                     content_parts.append(html_text.strip())
             except Exception:
@@ -253,32 +448,20 @@ def extract_msg(file_path):
         # 2. SAVE ATTACHMENTS AS SEPARATE FILES
         # -----------------------------------------
         attachment_count = 0
+        used_names = _existing_names(extract_to)
+        folder_prefix = extract_to + os.sep
         
         for attachment in msg.attachments:
             original_filename = attachment.longFilename or attachment.shortFilename or "unnamed"
-            filename = sanitize_filename(original_filename)
-            
-            # Detect correct file type and update filename
-            filename = get_filename_with_correct_extension(filename, attachment.data)
-            
-            filepath = os.path.join(extract_to, filename)
             
-            counter = 1
-            base_name = Path(filename).stem
-            extension = Path(filename).suffix
-            while os.path.exists(filepath):
-                filename = f"{base_name}_{counter}{extension}"
-                filepath = os.path.join(extract_to, filename)
-                counter += 1
-            
-            with open(filepath, 'wb') as f:
-                f.write(attachment.data)
+            # Detect correct file type, update filename and save as physical file
+            filename, detected_type, _ = _save_attachment(folder_prefix, original_filename, attachment.data, used_names)
             attachment_count += 1
-            detected_type = detect_file_type(attachment.data)
-            if original_filename != filename:
-                print(f"  ✓ Saved attachment: {filename} [detected: {detected_type}]")
-            else:
-                print(f"  ✓ Saved attachment: {filename}")
+            if debug:
+                if original_filename != filename:
+                    logger.debug(f"Saved attachment: {filename} [detected: {detected_type}]")
+                else:
+                    logger.debug(f"Saved attachment: {filename}")
         
         msg.close()
         
@@ -306,53 +489,60 @@ def extract_mbox(file_path):
     - Each message's metadata returned with merged content
     - Attachments saved as separate physical files in subfolders
     """
-    import mailbox
-    
     extract_to = get_extraction_name_file(file_path, '.mbox')
     os.makedirs(extract_to, exist_ok=True)
     
     total_attachments = 0
     messages_data = []
+    writer = ThreadPoolExecutor(max_workers=_ATTACHMENT_WRITERS, thread_name_prefix="attachment")
+    queue_write = functools.partial(writer.submit, _write_attachment)
     
     try:
-        mbox = mailbox.mbox(file_path)
-        
-        for idx, message in enumerate(mbox):
+        for idx, message in enumerate(_iter_mbox_messages(file_path)):
             subject = message.get('Subject', 'No Subject')
             safe_subject = sanitize_filename(subject)[:50]
             
             message_folder = os.path.join(extract_to, f"msg_{idx:03d}_{safe_subject}")
             
             # -----------------------------------------
-            # 1. EXTRACT MESSAGE METADATA + MERGED BODY CONTENT
+            # 1. MERGE BODY CONTENT + SAVE ATTACHMENTS (SINGLE WALK)
             # -----------------------------------------
             content_parts = []
-            
-            # Extract all text content
+            message_attachment_count = 0
+            used_names = {}
+            writes = []
             for part in message.walk():
-                if part.get_content_type() in ['text/plain', 'text/html']:
-                    disposition = part.get_content_disposition()
-                    # Skip attachments
-                    if disposition not in ['attachment', 'inline']:
-                        try:
-                            content = part.get_payload(decode=True)
-                            if content:
-                                text_content = content.decode('utf-8', errors='ignore')
-                                
-                                # Convert HTML to plain text
-                                if part.get_content_type() == 'text/html':
-                                    try:
-                                        import html2text
-                                        text_content = html2text.html2text(text_content)
-                                    except ImportError:
-                                        import re
-                                        text_content = re.sub('<[^<]+?>', '', text_content)
-                                
-                                if text_content.strip():
-                                    content_parts.append(text_content.strip())
-                        except Exception as e:
+                content_type = part.get_content_type()
+                disposition = part.get_content_disposition()
+                
+                if disposition in ['attachment', 'inline']:
+                    original_filename = part.get_filename()
+                    if original_filename:
+                        # Create message folder only if it has attachments
+                        if message_attachment_count == 0:
+                            os.makedirs(message_folder, exist_ok=True)
+                            used_names = _existing_names(message_folder)
+                            folder_prefix = message_folder + os.sep
+                        
+                        payload = part.get_payload(decode=True)
+                        if not payload:
                             continue
+                        
+                        # Detect correct file type, update filename and queue the write
+                        _, _, future = _save_attachment(folder_prefix, original_filename, payload, used_names, queue_write)
+                        writes.append(future)
+                        message_attachment_count += 1
+                        total_attachments += 1
+                
+                # Skip attachments, extract all text content
+                elif content_type in ['text/plain', 'text/html']:
+                    text_content = _decode_text_part(part, content_type)
+                    if text_content:
+                        content_parts.append(text_content)
             
+            # -----------------------------------------
+            # 2. MESSAGE METADATA
+            # -----------------------------------------
             msg_data = {
                 "source_filepath": file_path,
                 "message_index": idx,
@@ -365,40 +555,9 @@ def extract_mbox(file_path):
                 "content": "\n\n".join(content_parts) if content_parts else ""
             }
             
-            # -----------------------------------------
-            # 2. SAVE ATTACHMENTS AS SEPARATE FILES
-            # -----------------------------------------
-            message_attachment_count = 0
-            for part in message.walk():
-                if part.get_content_disposition() in ['attachment', 'inline']:
-                    original_filename = part.get_filename()
-                    if original_filename:
-                        # Create message folder only if it has attachments
-                        if message_attachment_count == 0:
-                            os.makedirs(message_folder, exist_ok=True)
-                        
-                        payload = part.get_payload(decode=True)
-                        if not payload:
-                            continue
-                        
-                        filename = sanitize_filename(original_filename)
-                        # Detect correct file type and update filename
-                        filename = get_filename_with_correct_extension(filename, payload)
-                        
-                        filepath = os.path.join(message_folder, filename)
-                        
-                        counter = 1
-                        base_name = Path(filename).stem
-                        extension = Path(filename).suffix
-                        while os.path.exists(filepath):
-                            filename = f"{base_name}_{counter}{extension}"
-                            filepath = os.path.join(message_folder, filename)
-                            counter += 1
-                        
-                        with open(filepath, 'wb') as f:
-                            f.write(payload)
-                        message_attachment_count += 1
-                        total_attachments += 1
+            # Wait for this message's attachments (re-raises the first write error)
+            for future in writes:
+                future.result()
             
             # Add attachment info to message data
             msg_data["attachment_count"] = message_attachment_count
@@ -424,6 +583,9 @@ def extract_mbox(file_path):
     except Exception as e:
         print(f"✗ Error extracting {file_path}: {str(e)}")
         return {"error": str(e), "filepath": file_path}
+    
+    finally:
+        writer.shutdown(wait=True)
 
 def extract_pst_pypff(file_path):
     """
@@ -440,11 +602,16 @@ def extract_pst_pypff(file_path):
     
     extract_to = get_extraction_name_file(file_path, '.pst')
     os.makedirs(extract_to, exist_ok=True)
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     total_attachments = 0
     attachment_counter = 0
+    used_names = _existing_names(extract_to)
+    folder_prefix = extract_to + os.sep
     messages_data = []
     message_counter = 0
+    writer = ThreadPoolExecutor(max_workers=_ATTACHMENT_WRITERS, thread_name_prefix="attachment")
+    queue_write = functools.partial(writer.submit, _write_attachment)
     
     try:
         pst = pypff.file()
@@ -459,12 +626,16 @@ def extract_pst_pypff(file_path):
             STRIP_RTF_AVAILABLE = False
             print("⚠ striprtf not installed. RTF bodies will be skipped.")
 
-        import html2text
-        h2t = html2text.HTML2Text()
-        h2t.ignore_links = True
+        h2t = None
+        if _html2text is not None:
+            h2t = _html2text.HTML2Text()
+            h2t.ignore_links = True
+            # No re-wrapping of the converted text
+            h2t.body_width = 0
 
         def process_folder(folder):
             nonlocal total_attachments, attachment_counter, message_counter
+            folder_attachments = 0
             
             # Process messages
             for i in range(folder.get_number_of_sub_messages()):
@@ -474,7 +645,7 @@ def extract_pst_pypff(file_path):
                 try:
                     message = folder.get_sub_message(i)
                 except Exception as e:
-                    print(f"⚠ Cannot access message {i}: {e}")
+                    logger.warning(f"Cannot access message {i}: {e}")
                     continue
 
                 message_counter += 1
@@ -525,26 +696,28 @@ def extract_pst_pypff(file_path):
                 try:
                     body = message.get_plain_text_body()
                     if isinstance(body, bytes):
-                        body = body.decode(errors="replace")
+                        body = _decode_body(body)
                     if body and body.strip():
                         content_parts.append(body.strip())
                 except Exception as e:
-                    print(f"⚠ Plain text error (msg {message_counter}): {e}")
+                    logger.warning(f"Plain text error (msg {message_counter}): {e}")
 
-                # HTML
-                try:
-                    body = message.get_html_body()
-                    if isinstance(body, bytes):
-                        body = body.decode(errors="replace")
-                    if body and body.strip():
-                        text = h2t.handle(body).strip()
-                        if text and (not content_parts or text != content_parts[0]):
-                            content_parts.append(text)
-                except Exception as e:
-                    print(f"⚠ HTML error (msg {message_counter}): {e}")
+                # HTML and RTF bodies are alternative renderings of the same
+                # message, so they are only converted when no plain text was found
+                if not content_parts:
+                    try:
+                        body = message.get_html_body()
+                        if isinstance(body, bytes):
+                            body = _decode_body(body)
+                        if body and body.strip():
+                            text = _html_to_text(body, h2t).strip()
+                            if text:
+                                content_parts.append(text)
+                    except Exception as e:
+                        logger.warning(f"HTML error (msg {message_counter}): {e}")
 
                 # RTF
-                if STRIP_RTF_AVAILABLE:
+                if STRIP_RTF_AVAILABLE and not content_parts:
                     try:
                         body = message.get_rtf_body()
                         if isinstance(body, bytes):
@@ -554,13 +727,15 @@ def extract_pst_pypff(file_path):
                             if text:
                                 content_parts.append(text)
                     except Exception as e:
-                        print(f"⚠ RTF error (msg {message_counter}): {e}")
+                        logger.warning(f"RTF error (msg {message_counter}): {e}")
 
                 msg_data["content"] = "\n\n".join(content_parts) if content_parts else ""
                 msg_data["to"] = ", ".join(recipients)
 
 
                 message_attachment_count = 0
+                # (future, attachment number, filename, original filename, detected type, size) per write
+                writes = []
                 
                 try:
                     num_attachments = message.get_number_of_attachments()
@@ -573,9 +748,15 @@ def extract_pst_pypff(file_path):
                             attachment = message.get_attachment(j)
                             attachment_counter += 1
                             
+                            # Only the first chunk is read here (enough to detect the type);
+                            # the rest of a large attachment is streamed to disk below
                             data = None
+                            size = 0
+                            streamed = False
                             try:
-                                data = attachment.read_buffer(attachment.get_size())
+                                size = attachment.get_size()
+                                data = attachment.read_buffer(min(size, _PST_CHUNK_SIZE))
+                                streamed = len(data) < size
                             except Exception:
                                 try:
                                     data = attachment.read()
@@ -583,11 +764,13 @@ def extract_pst_pypff(file_path):
                                     try:
                                         data = attachment.data
                                     except Exception:
-                                        print(f"  ⚠ Could not read data for attachment {attachment_counter}")
+                                        logger.warning(f"Could not read data for attachment {attachment_counter}")
                                         continue
                             
                             if not data:
                                 continue
+                            if not streamed:
+                                size = len(data)
                             
                             # Get original filename before processing
                             original_filename = None
@@ -596,45 +779,56 @@ def extract_pst_pypff(file_path):
                             except Exception:
                                 pass
                             
-                            if not original_filename:
-                                extension = detect_file_type(data)
-                                filename = f"attachment_{attachment_counter:05d}{extension}"
+                            if streamed:
+                                # pypff handles are not shared with the writer threads
+                                write = functools.partial(_stream_pst_attachment, attachment, size=size)
                             else:
-                                filename = sanitize_filename(original_filename)
-                                # Always detect and correct the extension based on actual file content
-                                filename = get_filename_with_correct_extension(filename, data)
-                            
-                            filepath = os.path.join(extract_to, filename)
+                                write = queue_write
                             
-                            counter = 1
-                            base_name = Path(filename).stem
-                            extension = Path(filename).suffix
-                            while os.path.exists(filepath):
-                                filename = f"{base_name}_{counter}{extension}"
-                                filepath = os.path.join(extract_to, filename)
-                                counter += 1
-                            
-                            with open(filepath, 'wb') as f:
-                                f.write(data)
-                            total_attachments += 1
-                            message_attachment_count += 1
-                            detected_type = detect_file_type(data)
-                            # Show detection info if filename was changed
-                            if original_filename and filename != original_filename:
-                                print(f"  Extracted: {filename} ({len(data)} bytes) [detected: {detected_type}, was: {Path(original_filename).suffix or 'no ext'}]")
-                            else:
-                                print(f"  Extracted: {filename} ({len(data)} bytes)")
+                            # Always detect and correct the extension based on actual file content
+                            # (unnamed attachments get the detected extension added)
+                            filename, detected_type, future = _save_attachment(
+                                folder_prefix, original_filename or f"attachment_{attachment_counter:05d}",
+                                data, used_names, write
+                            )
+                            writes.append((future, attachment_counter, filename, original_filename, detected_type, size))
                             
                         except Exception as e:
-                            print(f"  ⚠ Could not extract attachment {attachment_counter}: {str(e)[:80]}")
+                            logger.warning(f"Could not extract attachment {attachment_counter}: {str(e)[:80]}")
                             continue
                 
+                # Count this message's attachments once their writes have finished
+                for future, number, filename, original_filename, detected_type, size in writes:
+                    try:
+                        if future is not None:
+                            future.result()
+                    except Exception as e:
+                        logger.warning(f"Could not extract attachment {number}: {str(e)[:80]}")
+                        continue
+                    total_attachments += 1
+                    folder_attachments += 1
+                    message_attachment_count += 1
+                    if debug:
+                        # Show detection info if filename was changed
+                        if original_filename and filename != original_filename:
+                            logger.debug(f"Extracted: {filename} ({size} bytes) [detected: {detected_type}, was: {Path(original_filename).suffix or 'no ext'}]")
+                        else:
+                            logger.debug(f"Extracted: {filename} ({size} bytes)")
+                
                 # Add attachment info to message data
                 msg_data["attachment_count"] = message_attachment_count
                 msg_data["has_attachments"] = message_attachment_count > 0
                 
                 messages_data.append(msg_data)
             
+            # One line per folder instead of one per attachment
+            if folder_attachments:
+                try:
+                    folder_name = folder.get_name() or ""
+                except Exception:
+                    folder_name = ""
+                logger.info(f"Extracted {folder_attachments} attachment(s) from PST folder '{folder_name}'")
+            
             # Process subfolders
             for i in range(folder.get_number_of_sub_folders()):
                 try:
@@ -670,4 +864,14 @@ def extract_pst_pypff(file_path):
         print(f"✗ pypff Error: {str(e)[:200]}")
         return {"error": str(e), "filepath": file_path}
     
-    
\ No newline at end of file
+    finally:
+        writer.shutdown(wait=True)
+
+
+# Suffix -> (extractor, email_type)
+_EMAIL_HANDLERS = {
+    '.msg': (extract_msg, 'msg'),
+    '.eml': (extract_eml, 'eml'),
+    '.mbox': (extract_mbox, 'mbox'),
+    '.pst': (extract_pst_pypff, 'pst'),
+}
@@ -141,11 +141,19 @@ def read_image_file_fast(filepath , languages=None):
             # Preprocess image
             # Preprocess image
             if CV_AVAILABLE:
-                # Convert to RGB then to numpy array
-                rgb_img = img.convert("RGB")
-                arr = np.array(rgb_img)
-                processed = preprocess_for_ocr(arr, libs)
-                ocr_target = Image.fromarray(processed)
+                # Decode straight to grayscale with OpenCV (PIL is only used for
+                # the metadata above); np.fromfile keeps non-ASCII Windows paths
+                # working. Orientation is ignored, as PIL does.
+                arr = cv2.imdecode(
+                    np.fromfile(filepath, dtype=np.uint8),
+                    cv2.IMREAD_GRAYSCALE | cv2.IMREAD_IGNORE_ORIENTATION
+                )
+                if arr is None:
+                    # Formats OpenCV cannot decode (GIF, ICO, ...): convert to RGB
+                    # and view it as a (read-only) numpy array
+                    arr = np.asarray(img.convert("RGB"))
+                # pytesseract takes the uint8 array as is
+                ocr_target = preprocess_for_ocr(arr, libs)
                 
             else:
                 # No OpenCV, use image directly
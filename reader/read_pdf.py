@@ -120,9 +120,9 @@ def process_page_optimized(page_data):
         # Fast preprocessing
         # Fast preprocessing
         if cv2 and np:
-            img_array = np.array(pil_image.convert("RGB"))
-            processed = preprocess_for_ocr(img_array, libs=libs)
-            pil_processed = Image.fromarray(processed)
+            img_array = np.asarray(pil_image.convert("RGB"))
+            # pytesseract takes the uint8 array as is
+            pil_processed = preprocess_for_ocr(img_array, libs=libs)
         else:
             pil_processed = pil_image.convert("L")  # Simple grayscale
         